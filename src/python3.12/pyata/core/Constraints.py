@@ -3,9 +3,9 @@
 
 from __future__ import annotations
 from abc        import ABC, abstractmethod
-from collections.abc import Hashable
+from collections.abc import Hashable, Mapping
 from math import prod
-from typing     import Any, Callable, ClassVar, Iterable, Set, Self
+from typing     import Any, Callable, ClassVar, Iterable, Set, Self, cast
 
 import rich
 import rich.repr, rich.pretty
@@ -13,7 +13,7 @@ import rich.repr, rich.pretty
 from  .Types       import ( Ctx, GoalCtxSized, Var, Constraint, RichReprable
                           , isCtxClsRichReprable, isCtxSelfRichReprable )
 from  .Facets      import ( FacetABC, FacetRichReprMixin, HooksEvents   #
-                          , HookEventCB                                 )
+                          , HookEventCB, rich_repr_decor                )
 from  .Vars        import   Substitutions
 from  .Unification import   Unification
 from ..immutables  import   Set
@@ -33,6 +33,27 @@ class Constraints(FacetABC[Var, Set[Constraint]], FacetRichReprMixin[Var]):
     ) -> Ctx:
         return cls.set(ctx, var, cls.get(ctx, var).add(constraint))
 
+    @classmethod
+    def constrain_all(cls: type[Self], ctx: Ctx,
+        constraints: Iterable[Constraint]
+    ) -> Ctx:
+        """Register constraints on their variables in one facet update.
+        
+        Constraints with their own `constrain` are left to register
+        themselves.
+        """
+        by_var: dict[Var, list[Constraint]] = {}
+        for constraint in constraints:
+            if type(constraint).constrain is ConstraintVarsABC.constrain:
+                for var in cast(ConstraintVarsABC, constraint).vars:
+                    by_var.setdefault(var, []).append(constraint)
+            else:
+                ctx = constraint.constrain(ctx)
+        if by_var:
+            ctx = cls.update(ctx, {var: cls.get(ctx, var) | Set(cs)
+                                   for var, cs in by_var.items()})
+        return ctx
+
     @classmethod
     def propagate(cls: type[Self], ctx: Ctx, src: Var, dst: Var
     ) -> tuple[Ctx, Set[Constraint]]:
@@ -165,8 +186,8 @@ class ConstraintVarsABC(ConstraintABC, ABC):
         for var in self.vars:
             yield var
     
-    def __init_subclass__(cls: type[Self], **kwargs: Any) -> None:
-        super().__init_subclass__(**kwargs)
+    @classmethod
+    def _make_rich_repr_decor(cls: type[Self]) -> type[RichReprable]:
         class RichRepr[C: ConstraintVarsABC](RichReprable):
             def __init__(self: Self, ego: C, ctx: Ctx) -> None:
                 self.ego: C   = ego
@@ -183,10 +204,10 @@ class ConstraintVarsABC(ConstraintABC, ABC):
                         yield (rich.pretty.pretty_repr(cls._repr(ctx, v)),
                                cls._repr(ctx, w))
         RichRepr.__name__ = cls.__name__
-        cls.RichReprDecor = RichRepr
+        return RichRepr
     
     def __ctx_self_rich_repr__(self: Self, ctx: Ctx) -> tuple[Ctx, RichReprable]:
-        return ctx, self.RichReprDecor(self, ctx)
+        return ctx, rich_repr_decor(type(self))(self, ctx)
     
     @classmethod
     def _repr(cls: type[Self], ctx: Ctx, val: Any) -> Any:
@@ -324,7 +345,11 @@ class Notin(ConstraintVarsABC):
             if var not in collection)
         return new
 
-    def get_cset(self: Self, ctx: Ctx) -> tuple[Ctx, set[Any]]:
+    def get_cset(self: Self, ctx: Ctx
+                 ) -> tuple[Ctx, set[Any] | frozenset[Any]]:
+        if not self.cvars:
+            # nothing to walk, so values are shared instead of copied
+            return ctx, self.cvals
         cset = set(self.cvals)
         for var in self.cvars:
             ctx, val = Substitutions.walk(ctx, var)
@@ -335,9 +360,13 @@ class Notin(ConstraintVarsABC):
                          ) -> Iterable[Any]:
         """Finite discrete domain filter."""
         _, cset = self.get_cset(ctx)
-        for val in fd_domain:
-            if isinstance(val, Hashable) and val not in cset:
-                yield val
+        if isinstance(fd_domain, Mapping):
+            # keys are hashable already
+            if not cset:
+                return list(cast(Iterable[Any], fd_domain))
+            return [val for val in fd_domain if val not in cset]
+        return [val for val in fd_domain
+                if isinstance(val, Hashable) and val not in cset]
 
     def __rich_repr__(self: Self) -> rich.repr.Result:
         if isinstance(self.subj, tuple):
@@ -4,6 +4,7 @@
 from __future__  import annotations
 from abc         import ABC, abstractmethod
 from collections import abc as AB
+from functools   import lru_cache
 from typing      import ( Any, Callable, ClassVar, Final, Iterable, Literal, Mapping, NoReturn #
                         , Self, cast                                        )
 
@@ -23,7 +24,7 @@ __all__: list[str] = [
     'FacetABC'   , 'FacetRichReprMixin', 'CtxRichRepr'   , 'HooksABC',
     'HooksEvents', 'HooksBroadcasts'   , 'HooksPipelines', 'HooksShortCircuit',
     'HooksEffectfulCBs', 'Installations', 'Hypotheticals', 'Effemore', 'Cache',
-    'Installations'
+    'Installations', 'BoundedMemo'
 ]
 
 
@@ -155,12 +156,22 @@ class FacetABC[K: AB.Hashable, V: AB.Hashable](
     #           │ ---  END IF DEBUG SECTION --- END IF DEBUG SECTION --- │
     #           ╰────────────────────────────────────────────────────────╯ 
 
+def rich_repr_decor(cls: type[Any]) -> type[RichReprable]:
+    """RichRepr decorator class of a class, built on first use.
+    
+    The class makes it with its `_make_rich_repr_decor`, and it's kept in
+    the class's own `RichReprDecor`, so subclasses make their own."""
+    decor = cls.__dict__.get('RichReprDecor')
+    if decor is None:
+        decor = cls.RichReprDecor = cls._make_rich_repr_decor()
+    return cast(type[RichReprable], decor)
+
+
 class FacetRichReprMixin[K: AB.Hashable](FacetKeyOrd[K], FacetRichReprable, ABC):
     RichReprDecor: type[RichReprable]
     
     @classmethod
-    def __init_subclass__(cls: type[Self], **kwargs: Any) -> None:
-        super().__init_subclass__(**kwargs)
+    def _make_rich_repr_decor(cls: type[Self]) -> type[RichReprable]:
         class RichRepr(RichReprable):
             def __init__(self: Self, ctx: Ctx) -> None:
                 self.ctx: Ctx = ctx
@@ -172,7 +183,7 @@ class FacetRichReprMixin[K: AB.Hashable](FacetKeyOrd[K], FacetRichReprable, ABC)
                         yield (RY.pretty_repr(cls._key_repr(ctx, key)),
                                 cls._val_repr(ctx, key))
         RichRepr.__name__ = cls.__name__
-        cls.RichReprDecor = RichRepr
+        return RichRepr
     
     @classmethod
     def __ctx_cls_rich_repr__(cls: type[Self], ctx: Ctx) -> tuple[Ctx, RichReprable]:
@@ -184,7 +195,7 @@ class FacetRichReprMixin[K: AB.Hashable](FacetKeyOrd[K], FacetRichReprable, ABC)
         #     if richrepable is not None:
         #         return ctx, richrepable
 
-        richreprable = cls.RichReprDecor(ctx)
+        richreprable = rich_repr_decor(cls)(ctx)
         # cached.set(facet, richreprable)
         # ctx = FacetRichReprCache.set(ctx, cls, cached)
         return ctx, richreprable
@@ -315,8 +326,7 @@ class HooksABC[H: HookCB[Any]](
         return cls.set(ctx, key, cls.default)
     
     @classmethod
-    def __init_subclass__(cls: type[Self], **kwargs: Any) -> None:
-        super().__init_subclass__(**kwargs)
+    def _make_rich_repr_decor(cls: type[Self]) -> type[RichReprable]:
         class CBsRichReprBase(RichReprable):
             def __init__(self: Self, ctx: Ctx, key: Any) -> None:
                 self.ctx: Ctx = ctx
@@ -336,7 +346,7 @@ class HooksABC[H: HookCB[Any]](
                         CBsRichRepr.__name__ = cls._key_repr(self.ctx, key)
                     yield CBsRichRepr(self.ctx, key)
         RichRepr.__name__ = cls.__name__
-        cls.RichReprDecor = RichRepr
+        return RichRepr
     
     @classmethod
     def _key_repr(cls: type[Self], ctx: Ctx, key: Any) -> Any:
@@ -408,7 +418,9 @@ class HooksEvents[T](HooksABC[HookEventCB[T]]):
     @classmethod
     def run_all(cls: type[Self], ctx: Ctx, key: Any, arg: Any) -> Ctx:
         cb: HookEventCB[Any]
-        for cb in cons_to_iterable(cls.get(ctx, key)):
+        cell = cls.get(ctx, key)
+        while cell:
+            cb, cell = cell  # type: ignore
             try:
                 ctx = cb(ctx, arg)
             except HooksShortCircuit as e:
@@ -420,7 +432,9 @@ class HooksEvents[T](HooksABC[HookEventCB[T]]):
     @classmethod
     def run_pure(cls: type[Self], ctx: Ctx, key: Any, arg: Any) -> Ctx:
         cb: HookEventCB[Any]
-        for cb in cons_to_iterable(cls.get(ctx, key)):
+        cell = cls.get(ctx, key)
+        while cell:
+            cb, cell = cell  # type: ignore
             if HooksEffectfulCBs.get(ctx, cb):
                 continue
             try:
@@ -435,6 +449,12 @@ class HooksEvents[T](HooksABC[HookEventCB[T]]):
     run = run_all
 
 
+@lru_cache(maxsize=1024)
+def broadcast_prefixes(key: BroadcastKey) -> tuple[BroadcastKey, ...]:
+    """Prefixes of a broadcast key, longest first."""
+    return tuple(key[:i] for i in range(len(key), 0, -1))
+
+
 class HooksBroadcasts[T](HooksABC[HookBroadcastCB[T]]):
     @classmethod
     def run(cls: type[Self], ctx: Ctx, key: BroadcastKey, arg: T) -> Ctx:
@@ -445,8 +465,10 @@ class HooksBroadcasts[T](HooksABC[HookBroadcastCB[T]]):
     def run_all(cls: type[Self], ctx: Ctx, key: BroadcastKey, arg: T) -> Ctx:
         """Broadcast arg to key callbacks in context."""
         k: Any
-        for k in (key[:i] for i in range(len(key), 0, -1)):
-            for bcb in cons_to_iterable(cls.get(ctx, k)):
+        for k in broadcast_prefixes(key):
+            cell = cls.get(ctx, k)
+            while cell:
+                bcb, cell = cell  # type: ignore
                 try:
                     ctx = bcb(ctx, key, arg)
                 except HooksShortCircuit as e:
@@ -459,8 +481,10 @@ class HooksBroadcasts[T](HooksABC[HookBroadcastCB[T]]):
     def run_pure(cls: type[Self], ctx: Ctx, key: BroadcastKey, arg: T) -> Ctx:
         """Broadcast arg to key callbacks in context."""
         k: Any
-        for k in (key[:i] for i in range(len(key), 0, -1)):
-            for bcb in cons_to_iterable(cls.get(ctx, k)):
+        for k in broadcast_prefixes(key):
+            cell = cls.get(ctx, k)
+            while cell:
+                bcb, cell = cell  # type: ignore
                 if HooksEffectfulCBs.get(ctx, bcb):
                     continue
                 try:
@@ -471,6 +495,12 @@ class HooksBroadcasts[T](HooksABC[HookBroadcastCB[T]]):
                     break
         return ctx
     
+    @classmethod
+    def is_hooked(cls: type[Self], ctx: Ctx, key: BroadcastKey) -> bool:
+        """Whether a broadcast to key has any callbacks to reach."""
+        whole = cls.get_whole(ctx)
+        return any(whole.get(k) for k in broadcast_prefixes(key))
+    
     # Override indirections to run_all, for now.
     run = run_all
 
@@ -485,7 +515,9 @@ class HooksPipelines[T](HooksABC[HookPipelineCB[T]]):
     def run_all(cls: type[Self], ctx: Ctx, key: Any, arg: T) -> tuple[Ctx, T]:
         """Pipeline arg through key callbacks in context."""
         cb: HookPipelineCB[T]
-        for cb in cons_to_iterable(cls.get(ctx, key)):
+        cell = cls.get(ctx, key)
+        while cell:
+            cb, cell = cell  # type: ignore
             try:
                 ctx, arg = cb(ctx, arg)
             except HooksShortCircuit as e:
@@ -502,7 +534,9 @@ class HooksPipelines[T](HooksABC[HookPipelineCB[T]]):
     def run_pure(cls: type[Self], ctx: Ctx, key: Any, arg: T) -> tuple[Ctx, T]:
         """Pipeline arg through key callbacks in context."""
         cb: HookPipelineCB[T]
-        for cb in cons_to_iterable(cls.get(ctx, key)):
+        cell = cls.get(ctx, key)
+        while cell:
+            cb, cell = cell  # type: ignore
             if HooksEffectfulCBs.get(ctx, cb):
                 continue
             try:
@@ -649,3 +683,36 @@ class Cache(FacetABC[AB.Hashable, tuple[Any, ...] | None]):
         return cls.ctx_invoke_and_store(
             ctx, fun,  # pyright: ignore[reportArgumentType]
             *args, **kwargs)
+
+
+class BoundedMemo[K, V]:
+    """Results memoized by key, the least recently used evicted past `bound`.
+    
+    Keyed `by_id`, keys are compared by identity, so needn't be hashable,
+    and are kept alive by the memo, so their ids aren't reused."""
+    __slots__ = ('bound', 'by_id', 'results')
+    bound: int
+    by_id: bool
+    results: dict[Any, tuple[K, V]]
+    
+    def __init__(self: Self, bound: int, *, by_id: bool = False) -> None:
+        self.bound = bound
+        self.by_id = by_id
+        self.results = {}
+    
+    def __call__(self: Self, key: K, compute: Callable[[K], V]) -> V:
+        """Memoized result for `key`, computed from it on a miss."""
+        results = self.results
+        mkey = id(key) if self.by_id else key
+        hit = results.pop(mkey, None)
+        if hit is not None:
+            results[mkey] = hit  # the most recently used go last
+            return hit[1]
+        val = compute(key)
+        results[mkey] = (key, val)
+        if len(results) > self.bound:
+            del results[next(iter(results))]  # evict the least recent
+        return val
+    
+    def __len__(self: Self) -> int:
+        return len(self.results)
@@ -2,27 +2,26 @@
 # -*- coding: utf-8; mode: python -*-
 
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import Counter, deque
+from heapq import heappop, heappush
 import collections.abc as AB
 from itertools import chain
 from math import prod
-from more_itertools import interleave_longest
-from typing import Any, Iterable, Self
+from types import MappingProxyType
+from typing import Any, ClassVar, Iterable, Iterator, Self, Sequence, cast
 
-import rich, \
-    scipy          # type: ignore
-import rich.pretty, rich.repr, \
-    scipy.special  # pyright: ignore[reportMissingTypeStubs]
+import rich
+import rich.pretty, rich.repr
 
-from .Constraints import PositiveCardinalityProduct
-from .Facets      import ( HooksPipelines, HookPipelineCB
-                         , Installations )
+from .Constraints import Constraints, PositiveCardinalityProduct
+from .Facets      import ( HooksPipelines, HookPipelineCB, BoundedMemo
+                         , Installations, rich_repr_decor )
 from .Types       import (Var, Ctx, Goal, GoalVared, GoalCtxSized,
                           GoalCtxSizedVared, Constraint, Stream,
                           Connective, MaybeCtxSized, RichReprable,
                           CtxSelfRichReprable, Named, CtxInstallable)
 from .Unification import Unification
-from .Vars        import Vars, Substitutions
+from .Vars        import Vars, Substitutions, __
 from ..immutables import Map, Set
 
 __all__: list[str] = [
@@ -32,21 +31,146 @@ __all__: list[str] = [
     'discern_goals', 'discriminate_goals',
 ]
 
-mconcat = interleave_longest
+def interleave(*streams: Stream) -> Stream:
+    """Round-robin over streams, dropping the exhausted ones."""
+    if len(streams) == 2:
+        # Two streams alternate without a queue.
+        first, second = map(iter, streams)
+        for ctx in first:
+            yield ctx
+            for ctx in second:
+                yield ctx
+                break
+            else:
+                yield from first
+                return
+        yield from second
+        return
+    queue = deque(map(iter, streams))
+    popleft, append = queue.popleft, queue.append
+    while queue:
+        stream = popleft()
+        for ctx in stream:
+            append(stream)
+            yield ctx
+            break
+
+mconcat = interleave
 
 def mbind(stream: Stream, goal: Goal) -> Stream:
     for ctx in stream:
         yield from goal(ctx)
 
+def conjoin(ctx: Ctx, goals: Sequence[Goal]) -> Stream:
+    """Depth-first bind of goals.
+    
+    Short conjunctions are common, and get straight nested loops.
+    """
+    match len(goals):
+        case 1:
+            return goals[0](ctx)
+        case 2:
+            return _conjoin2(ctx, *goals)
+        case 3:
+            return _conjoin3(ctx, *goals)
+        case 4:
+            return _conjoin4(ctx, *goals)
+        case _:
+            return _conjoin_stack(ctx, goals)
+
+def _conjoin2(ctx: Ctx, g0: Goal, g1: Goal) -> Stream:
+    for c0 in g0(ctx):
+        yield from g1(c0)
+
+def _conjoin3(ctx: Ctx, g0: Goal, g1: Goal, g2: Goal) -> Stream:
+    for c0 in g0(ctx):
+        for c1 in g1(c0):
+            yield from g2(c1)
+
+def _conjoin4(ctx: Ctx, g0: Goal, g1: Goal, g2: Goal, g3: Goal) -> Stream:
+    for c0 in g0(ctx):
+        for c1 in g1(c0):
+            for c2 in g2(c1):
+                yield from g3(c2)
+
+def _conjoin_stack(ctx: Ctx, goals: Sequence[Goal]) -> Stream:
+    """Depth-first bind of goals, driven by one explicit iterator stack."""
+    # The last goal's streams are delegated to, never stacked.
+    *inner, last = goals
+    depth_last = len(inner)
+    stack: list[Iterator[Ctx]] = [iter(goals[0](ctx))]
+    push, pop = stack.append, stack.pop
+    while stack:
+        for ctx in stack[-1]:
+            depth = len(stack)
+            if depth == depth_last:
+                yield from last(ctx)
+            else:
+                push(iter(inner[depth](ctx)))
+                break
+        else:
+            pop()
+
+def merge_distributions(goals: Iterable[GoalCtxSizedVared]
+) -> dict[Var, dict[Any, int]]:
+    """Per-var value counts of the goals, summed."""
+    merged: dict[Var, Counter[Any]] = {}
+    for goal in goals:
+        for var, distrib in goal.distribution.items():
+            acc = merged.get(var)
+            if acc is None:
+                merged[var] = Counter(distrib)
+            else:
+                acc.update(distrib)
+    return cast(dict[Var, dict[Any, int]], merged)
+
+# Goal trait bits
+VARED      : int = 1
+SIZED      : int = 2
+SIZED_VARED: int = 4
+
+# Bucket of `discriminate_goals` by trait bits: sized-vared, only sized,
+# only vared, others, and sized vared goals without a distribution, which
+# belong to none of the categories.
+_TRAITS_BUCKET: tuple[int, ...] = (3, 2, 1, 4, 0, 0, 0, 0)
+
+def goal_traits(goal: Goal) -> int:
+    """Trait bits of a goal, cached on the goal when it allows.
+    
+    Protocol isinstance checks are slow, and a goal's traits are fixed
+    once it is constructed.
+    """
+    try:
+        return goal._traits  # type: ignore
+    except AttributeError:
+        pass
+    traits = (VARED       * isinstance(goal, GoalVared)
+            | SIZED       * isinstance(goal, GoalCtxSized)
+            | SIZED_VARED * isinstance(goal, GoalCtxSizedVared))
+    try:
+        goal._traits = traits  # type: ignore
+    except AttributeError:
+        pass
+    return traits
+
 def discern_goals(
     goals: Iterable[Goal]
 ) -> tuple[list[GoalCtxSizedVared],
            list[GoalCtxSized],
            list[GoalVared]]:
     """Subsets of goals based on their includive trait categories."""
-    return ([g for g in goals if isinstance(g, GoalCtxSizedVared)],
-            [g for g in goals if isinstance(g, GoalCtxSized)],
-            [g for g in goals if isinstance(g, GoalVared)])
+    varedsized: list[GoalCtxSizedVared] = []
+    sized: list[GoalCtxSized] = []
+    vared: list[GoalVared] = []
+    for goal in goals:
+        traits = goal_traits(goal)
+        if traits & SIZED_VARED:
+            varedsized.append(cast(GoalCtxSizedVared, goal))
+        if traits & SIZED:
+            sized.append(cast(GoalCtxSized, goal))
+        if traits & VARED:
+            vared.append(cast(GoalVared, goal))
+    return varedsized, sized, vared
 
 def discriminate_goals(
     goals: Iterable[Goal]
@@ -55,31 +179,32 @@ def discriminate_goals(
            list[GoalVared],
            list[Goal]]:
     """Partition goals into exclusive trait categories."""
-    return ([g for g in goals if isinstance(g, GoalCtxSizedVared)],
-            [g for g in goals if (isinstance(g, GoalCtxSized) and
-                                  not isinstance(g, GoalVared))],
-            [g for g in goals if (isinstance(g, GoalVared) and
-                                  not isinstance(g, GoalCtxSized))],
-            [g for g in goals if (not isinstance(g, GoalVared) and
-                                  not isinstance(g, GoalCtxSized))])
+    buckets: tuple[list[Any], ...] = ([], [], [], [], [])
+    for goal in goals:
+        buckets[_TRAITS_BUCKET[goal_traits(goal)]].append(goal)
+    varedsized, onlysized, onlyvared, others, _ = buckets
+    return varedsized, onlysized, onlyvared, others
+
+def infer_name(obj: object, name: str | None = None) -> str:
+    """The given name, or one inferred from the object or its class."""
+    if name is not None:
+        return name
+    try:
+        return obj.__name__  # type: ignore
+    except AttributeError:
+        try:
+            return obj.__class__.__name__
+        except AttributeError as e:
+            raise TypeError(f'Cannot infer name for {obj!r}. ') from e
 
 class GoalABC(ABC, Goal, Named, CtxSelfRichReprable):
+    __slots__ = ('name', '_traits')
+    
     name: str
     RichReprDecor: type[RichReprable]
     
     def __init__(self: Self, *, name: str | None = None) -> None:
-        if name is None:
-            try:
-                self.name = self.__name__  # type: ignore
-            except AttributeError:
-                try:
-                    self.name = self.__class__.__name__  # type: ignore
-                except AttributeError as e:
-                    raise TypeError(
-                        f'Cannot infer name for {self!r}. '
-                    ) from e
-        else:
-            self.name = name
+        self.name = infer_name(self, name)
     
     @abstractmethod
     def __call__(self: Self, ctx: Ctx) -> Stream:
@@ -92,8 +217,8 @@ class GoalABC(ABC, Goal, Named, CtxSelfRichReprable):
             for var in self.vars:
                 yield var
     
-    def __init_subclass__(cls: type, **kwargs: Any) -> None:
-        super().__init_subclass__(**kwargs)
+    @classmethod
+    def _make_rich_repr_decor(cls: type[Self]) -> type[RichReprable]:
         class RichRepr[C: GoalABC](RichReprable):
             def __init__(self: Self, ego: C, ctx: Ctx) -> None:
                 self.ego: C   = ego
@@ -115,53 +240,76 @@ class GoalABC(ABC, Goal, Named, CtxSelfRichReprable):
                         else:
                             yield rich.pretty.pretty_repr(var), val
         RichRepr.__name__ = cls.__name__
-        cls.RichReprDecor = RichRepr
+        return RichRepr
     
     def __ctx_self_rich_repr__(self: Self, ctx: Ctx
                                ) -> tuple[Ctx, RichReprable]:
-        return ctx, self.RichReprDecor(self, ctx)
+        return ctx, rich_repr_decor(type(self))(self, ctx)
     
     def progress(self: Self, cur: int, tot: int) -> None:
         pass
 
 
 class GoalVaredABC(GoalABC, GoalVared, ABC):
+    __slots__ = ()
+    
     vars: tuple[Var, ...]
     
     def get_ctx_vars(self: Self, ctx: Ctx
     ) -> Iterable[Var]:
-        for var in self.vars:
-            ctx, val = Substitutions.walk(ctx, var)
+        _, vals = Substitutions.walk_many(ctx, self.vars)
+        for val in vals:
             if isinstance(val, Var):
                 yield val
 
 
 class Succeed(GoalABC):
+    __slots__ = ()
+    
     def __call__(self: Self, ctx: Ctx) -> Stream:
-        yield ctx
+        return (ctx,)
 
 
 class Fail(GoalABC):
+    __slots__ = ()
+    
     def __call__(self: Self, ctx: Ctx) -> Stream:
-        return
-        yield
+        return ()
 
 
 class Eq(GoalVaredABC):
+    __slots__ = ('vars', 'a', 'b', '_var', '_val')
+    
     a: Any
     b: Any
+    _var: Var | None
+    _val: Any
     
     def __init__(self: Self, a: Any, b: Any, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.a = a
         self.b = b
         self.vars = tuple(v for v in (a, b) if isinstance(v, Var))
+        # Var against non-var is the common case, decided once here.
+        self._var, self._val = None, None
+        if isinstance(a, Var) and not isinstance(b, Var):
+            self._var, self._val = a, b
+        elif isinstance(b, Var) and not isinstance(a, Var):
+            self._var, self._val = b, a
 
     def __call__(self: Self, ctx: Ctx) -> Stream:
-        ctx = Unification.unify(ctx, self.a, self.b)
+        var = self._var
+        if var is None:
+            ctx = Unification.unify(ctx, self.a, self.b)
+        else:
+            ctx, val = Substitutions.walk(ctx, var)
+            if isinstance(val, Var) and val is not __:
+                ctx = Substitutions.sub(ctx, val, self._val)
+            else:
+                ctx = Unification.unify(ctx, val, self._val)
         if ctx is Unification.Failed:
-            return
-        yield ctx
+            return ()
+        return (ctx,)
     
     def __rich_repr__(self: Self) -> rich.repr.Result:
         yield self.a
@@ -169,11 +317,35 @@ class Eq(GoalVaredABC):
 
 
 class ConnectiveABC(GoalVaredABC, Connective, ABC):
+    # Trait attributes (`vars`, `distribution`, `__ctx_len__`) are set
+    # only when the goals allow it, so they stay in `__dict__`: runtime
+    # protocol checks would see their slot descriptors as present.
+    __slots__ = ('goals', 'constraints', 'var_to_goals', '_ctx_sized_goals',
+                 '_ctx_len_memo', '_entanglement',
+                 '_static_ctx_entanglement', '_heuristic_memo', '__dict__')
+    
     goals: tuple[Goal, ...]
     constraints: tuple[Constraint, ...]
     var_to_goals: Map[Var, Set[GoalVared]]
     RichReprDecor: type[RichReprable]
     
+    _ctx_sized_goals: tuple[GoalCtxSized, ...]
+    _ctx_len_memo: BoundedMemo[Ctx, int]
+    _entanglement: AB.Mapping[GoalVared, int] | None
+    _static_ctx_entanglement: tuple[
+        MappingProxyType[GoalVared, int],
+        MappingProxyType[Var, frozenset[GoalVared]],
+        MappingProxyType[GoalVared, frozenset[Var]]] | None
+    _heuristic_memo: BoundedMemo[Ctx, tuple[Ctx,
+                                            tuple[Constraint, ...],
+                                            tuple[Goal, ...]]]
+    _hook_heuristic_key: ClassVar[Any]
+    
+    def __init_subclass__(cls: type[Self], **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Bound once per class, instead of on every call.
+        cls._hook_heuristic_key = cls.hook_heuristic
+    
     def __init__(self: Self, goal: Goal, *g_or_c: Goal | Constraint,
                  **kwargs: Any
     ) -> None:
@@ -188,24 +360,32 @@ class ConnectiveABC(GoalVaredABC, Connective, ABC):
         self.constraints = tuple(constraints)
         self.goals = (goal, *goals)
         self.var_to_goals = Map[Var, Set[GoalVared]]()
+        self._entanglement = None
+        self._static_ctx_entanglement = None
+        self._heuristic_memo = BoundedMemo(1, by_id=True)
+        self._ctx_sized_goals = tuple(
+            cast(GoalCtxSized, g) for g in self.goals
+            if goal_traits(g) & SIZED)
         
-        if (isinstance(self, MaybeCtxSized)
-            and any(isinstance(g, GoalCtxSized) for g in self.goals)):
+        if isinstance(self, MaybeCtxSized) and self._ctx_sized_goals:
             # This check is needed for composable nested connectives
             # to propagate Sized-ness when possible.
-            self.__ctx_len__ = self.__maybe_ctx_len__
+            self._ctx_len_memo = BoundedMemo(1, by_id=True)
+            self.__ctx_len__ = self.__memo_ctx_len__
         
-        # Vared duck-type
-        vars: list[Var] = []
-        for goal in self.goals:
-            if isinstance(goal, GoalVared):
-                for var in goal.vars:
-                    if var not in vars:
-                        vars.append(var)
-                    self.var_to_goals.set(
-                        var, self.var_to_goals.get(
-                            var, Set[GoalVared]()).add(goal))
+        # Vared duck-type (dict keys keep insertion order of unique vars),
+        # with var to goals index built mutable, then frozen once.
+        vars: dict[Var, list[GoalVared]] = {}
+        for goal in self._iter_vared(self.goals):
+            for var in goal.vars:
+                gs = vars.get(var)
+                if gs is None:
+                    vars[var] = [goal]
+                else:
+                    gs.append(goal)
         if vars:
+            self.var_to_goals = Map[Var, Set[GoalVared]](
+                {var: Set[GoalVared](gs) for var, gs in vars.items()})
             self.vars: tuple[Var, ...] = tuple(vars)
     
     def get_entanglement(self: Self) -> AB.Mapping[GoalVared, int]:
@@ -214,11 +394,15 @@ class ConnectiveABC(GoalVaredABC, Connective, ABC):
         Entanglement is a measure of shared variables between goals.
         Computed as the product of the number of goals sharing a variable
         for goal's variables minus 1. 0 means no shared variables.
+        
+        It depends only on the goals, so it is computed once and cached.
         """
-        return {goal: sum((max((0, len(self.var_to_goals[var]) - 1))
-                            for var in goal.vars))
-                for goal in (g for g in self.goals
-                             if isinstance(g, GoalVared))}
+        if self._entanglement is None:
+            self._entanglement = {
+                goal: sum((max((0, len(self.var_to_goals[var]) - 1))
+                           for var in goal.vars))
+                for goal in self._iter_vared(self.goals)}
+        return self._entanglement
     
     def get_ctx_entanglement(self: Self, ctx: Ctx,
                              goals: Iterable[Goal] | None = None
@@ -232,34 +416,96 @@ class ConnectiveABC(GoalVaredABC, Connective, ABC):
         is useful since heuristics may contextually modify the goals of
         a connective.
         """
-        vared: list[GoalVared]
         if goals is None:
             goals = self.goals
-        vared = [g for g in goals if isinstance(g, GoalVared)]
+        vared = list(self._iter_vared(goals))
+        # Without substitutions of our vars, walking changes nothing, and
+        # the same goals (in any order) give the same static result.
+        static = self._get_static_ctx_entanglement()
+        subs = Substitutions.get_whole(ctx)
+        if (len(vared) == len(static[2])
+            and all(g in static[2] for g in vared)
+            and not any(var in subs for var in self.var_to_goals)):
+            return ctx, *static
         # these may be different from self.vars after walking
-        goal_to_vars: dict[GoalVared, set[Var]] = defaultdict(set)
-        var_to_goals: dict[Var, set[GoalVared]] = defaultdict(set)
+        goal_to_vars: dict[GoalVared, set[Var]] = {}
+        var_to_goals: dict[Var, set[GoalVared]] = {}
         for goal in vared:
+            gvars: set[Var] = set()
+            goal_to_vars[goal] = gvars
             for var in goal.get_ctx_vars(ctx):
-                var_to_goals[var].add(goal)
-                goal_to_vars[goal].add(var)
-        return (ctx,
-                # {goal: sum((max((0, len(var_to_goals[var]) - 1))
-                #              for var in goal_to_vars[goal]))
-                #  for goal in vared},
-                {goal: prod([len(var_to_goals[var])
-                             for var in goal_to_vars[goal]]) - 1
-                 for goal in vared},
-                var_to_goals,
-                goal_to_vars)
-
+                gvars.add(var)
+                vgoals = var_to_goals.get(var)
+                if vgoals is None:
+                    var_to_goals[var] = {goal}
+                else:
+                    vgoals.add(goal)
+        # {goal: sum((max((0, len(var_to_goals[var]) - 1))
+        #              for var in goal_to_vars[goal]))
+        #  for goal in vared},
+        entanglement: dict[GoalVared, int] = {}
+        for goal in vared:
+            product = 1
+            for var in goal_to_vars[goal]:
+                product *= len(var_to_goals[var])
+            entanglement[goal] = product - 1
+        return ctx, entanglement, var_to_goals, goal_to_vars
+    
+    def _iter_vared(self: Self, goals: Iterable[Goal]
+    ) -> Iterator[GoalVared]:
+        """Vared goals, with cached trait bits."""
+        for goal in goals:
+            if goal_traits(goal) & VARED:
+                yield cast(GoalVared, goal)
+    
+    def _get_static_ctx_entanglement(self: Self
+    ) -> tuple[MappingProxyType[GoalVared, int],
+               MappingProxyType[Var, frozenset[GoalVared]],
+               MappingProxyType[GoalVared, frozenset[Var]]]:
+        """Contextual entanglement of own goals, when no var is bound.
+        
+        It's cached and shared by callers, so it's read-only."""
+        if self._static_ctx_entanglement is None:
+            var_to_goals = {var: frozenset(gs)
+                            for var, gs in self.var_to_goals.items()}
+            goal_to_vars = {g: frozenset(g.vars)
+                            for g in self._iter_vared(self.goals)}
+            entanglement = {goal: prod([len(var_to_goals[var])
+                                        for var in vars]) - 1
+                            for goal, vars in goal_to_vars.items()}
+            self._static_ctx_entanglement = (
+                MappingProxyType(entanglement),
+                MappingProxyType(var_to_goals),
+                MappingProxyType(goal_to_vars))
+        return self._static_ctx_entanglement
+
+    def __memo_ctx_len__(self: Self, ctx: Ctx) -> int:
+        """Size of the last seen context is reused.
+        
+        Cardinality constraints and heuristics ask for sizes of the same
+        goals repeatedly within one context.
+        """
+        return self._ctx_len_memo(
+            ctx, self.__maybe_ctx_len__)  # type: ignore
+    
     def __call__(self: Self, ctx: Ctx) -> Stream:
+        if not HooksPipelines.get(ctx, type(self)._hook_heuristic_key):
+            # Without heuristics there is nothing to run or remember.
+            constraints, goals = self.constraints, self.goals
+        else:
+            # Heuristics are a function of the context, so the result for
+            # the last seen context is reused.
+            ctx, constraints, goals = self._heuristic_memo(
+                ctx, self._run_heuristics)
+        ctx = Constraints.constrain_all(ctx, constraints)
+        return self._compose_goals(ctx, goals)
+    
+    def _run_heuristics(self: Self, ctx: Ctx
+    ) -> tuple[Ctx, tuple[Constraint, ...], tuple[Goal, ...]]:
         ctx, (_, constraints, goals) = HooksPipelines.run(
-            ctx, type(self).hook_heuristic,
+            ctx, type(self)._hook_heuristic_key,
             (self, self.constraints, self.goals))
-        for constraint in constraints:
-            ctx = constraint.constrain(ctx)
-        return self._compose_goals(ctx, goals)
+        return ctx, constraints, goals
     
     @classmethod
     @abstractmethod
@@ -282,8 +528,8 @@ class ConnectiveABC(GoalVaredABC, Connective, ABC):
         for goal in self.goals:
             yield goal
     
-    def __init_subclass__(cls: type[Self], **kwargs: Any) -> None:
-        # super().__init_subclass__(**kwargs)
+    @classmethod
+    def _make_rich_repr_decor(cls: type[Self]) -> type[RichReprable]:
         class RichRepr[C: ConnectiveABC](RichReprable):
             def __init__(self: Self, ego: C, ctx: Ctx) -> None:
                 self.ego: C   = ego
@@ -315,10 +561,7 @@ class ConnectiveABC(GoalVaredABC, Connective, ABC):
                 if ego.var_to_goals:
                     yield 'constraining_vars', ego.var_to_goals
         RichRepr.__name__ = cls.__name__
-        cls.RichReprDecor = RichRepr
-    
-    def __ctx_self_rich_repr__(self: Self, ctx: Ctx) -> tuple[Ctx, RichReprable]:
-        return ctx, self.RichReprDecor(self, ctx)
+        return RichRepr
 
 ######################################################################
 #  TODO: Utilize the engine itself to optimize the search order.
@@ -327,45 +570,46 @@ class ConnectiveABC(GoalVaredABC, Connective, ABC):
 ######################################################################
 
 class And(ConnectiveABC, MaybeCtxSized):
+    __slots__ = ()
+    
     def __init__(self: Self, goal: Goal, *g_or_c: Goal | Constraint,
                     **kwargs: Any) -> None:
         super().__init__(goal, *g_or_c, **kwargs)
-        if any(isinstance(g, GoalCtxSizedVared) for g in self.goals):
-            self.distribution: dict[Var, dict[Any, int]] = defaultdict(
-                lambda: defaultdict(int))
-            for goal in self.goals:
-                if isinstance(goal, GoalCtxSizedVared):
-                    for var, distrib in goal.distribution.items():
-                        for val, num in distrib.items():
-                            self.distribution[var][val] += num
+        sizedvared = [cast(GoalCtxSizedVared, g) for g in self.goals
+                      if goal_traits(g) & SIZED_VARED]
+        if sizedvared:
+            self.distribution: dict[Var, dict[Any, int]] = \
+                merge_distributions(sizedvared)
+    
+    def __call__(self: Self, ctx: Ctx) -> Stream:
+        if len(self.goals) == 1:
+            # A single conjunct has nothing to order, so heuristics
+            # are skipped.
+            ctx = Constraints.constrain_all(ctx, self.constraints)
+            return self.goals[0](ctx)
+        return super().__call__(ctx)
     
     @classmethod
     def _compose_goals(cls: type[Self], ctx: Ctx,
                        goals: tuple[Goal, ...]
     ) -> Stream:
-        stream: Stream = goals[0](ctx)
-        for goal in goals[1:]:
-            stream = mbind(stream, goal)
-        return stream
+        return conjoin(ctx, goals)
     
     def __maybe_ctx_len__(self: Self, ctx: Ctx) -> int:
-        return prod(g.__ctx_len__(ctx)
-                    for g in self.goals
-                    if isinstance(g, GoalCtxSized))
+        return prod(g.__ctx_len__(ctx) for g in self._ctx_sized_goals)
 
 
 class Or(ConnectiveABC, MaybeCtxSized):
+    __slots__ = ()
+    
     def __init__(self: Self, goal: Goal, *g_or_c: Goal | Constraint,
                     **kwargs: Any) -> None:
             super().__init__(goal, *g_or_c, **kwargs)
-            if any(isinstance(g, GoalCtxSizedVared) for g in self.goals):
-                self.distribution: dict[Var, dict[Any, int]] = defaultdict(
-                    lambda: defaultdict(int))
-                for goal in self.goals:
-                    if isinstance(goal, GoalCtxSizedVared):
-                        for var, distrib in goal.distribution.items():
-                            for val, num in distrib.items():
-                                self.distribution[var][val] += num
+            sizedvared = [cast(GoalCtxSizedVared, g) for g in self.goals
+                          if goal_traits(g) & SIZED_VARED]
+            if sizedvared:
+                self.distribution: dict[Var, dict[Any, int]] = \
+                    merge_distributions(sizedvared)
     
     @classmethod
     def _compose_goals(cls: type[Self], ctx: Ctx,
@@ -374,9 +618,7 @@ class Or(ConnectiveABC, MaybeCtxSized):
         return mconcat(*(goal(ctx) for goal in goals))
 
     def __maybe_ctx_len__(self: Self, ctx: Ctx) -> int:
-        return sum(g.__ctx_len__(ctx)
-                   for g in self.goals
-                   if isinstance(g, GoalCtxSized))
+        return sum(g.__ctx_len__(ctx) for g in self._ctx_sized_goals)
 
 
 # TODO: abstract generalized heuristic protocol.
@@ -411,14 +653,12 @@ class HeurConjCardinality(ConjunctiveHeuristic):
         varedsized, _, _, _ = discriminate_goals(goals)
         ctx, _, v2g, _ = connective.get_ctx_entanglement(
             ctx, goals)
-        cardinality_constraints: list[PositiveCardinalityProduct] = []
-        varsized_set = set(varedsized)
-        for var, gs in v2g.items():
-            cardinality_constraints.append(
-                PositiveCardinalityProduct((var,), tuple(
-                    g for g in gs if g in varsized_set)))
+        varsized_set = frozenset(varedsized)
+        cardinality_constraints = tuple(
+            PositiveCardinalityProduct((var,), tuple(gs & varsized_set))
+            for var, gs in v2g.items())
         data_procced = (
-            connective, (*constraints, *cardinality_constraints), goals)
+            connective, constraints + cardinality_constraints, goals)
         return ctx, data_procced
 
 
@@ -431,37 +671,64 @@ class HeurConjChainVars(ConjunctiveHeuristic):
         # Order conjunction goals by their search-space size over magnitude
         # of entanglement, clustering goals by their shared variables.
         connective, constraints, goals = data
+        if len(goals) < 2:
+            return ctx, data
         varedsized, onlysized, onlyvared, others = discriminate_goals(goals)
         sizes = {g: g.__ctx_len__(ctx) for g in chain(varedsized, onlysized)}
+        for goal, size in sizes.items():
+            if not size:
+                # An empty goal fails the conjunction, so it goes first
+                # and nothing else needs ordering.
+                return ctx, (connective, constraints, (
+                    goal, *(g for g in goals if g is not goal)))
         ctx, entanglement, v2g, g2v = connective.get_ctx_entanglement(
             ctx, goals)
-        def order_key(goal: GoalCtxSizedVared) -> float:
-            return sizes[goal] / (entanglement[goal] + 1)
-        varedsized.sort(key=order_key)
-        staged: set[GoalCtxSizedVared] = set()
-        for i in range(len(varedsized) - 2):
-            goal = varedsized[i]
-            proced = varedsized[0:i+1]
-            staged = staged.union(g for v in g2v[goal] for g in v2g[v]
-                                  if g not in proced
-                                  and isinstance(g, GoalCtxSizedVared))
-            staged.discard(goal)
-            # if chain is broken, we act as if remaining goals were staged
-            # for the iteration.
-            if not staged:
-                staged_ = set(varedsized[i+1:])
-            else:
-                staged_ = staged
-            assert len(staged_) > 0
-            ix_staged = [ix for ix in range(i + 1, len(varedsized))
-                        if varedsized[ix] in staged_]
-            ix_staged.sort(key=lambda ix: order_key(varedsized[ix]))
-            ix0 = ix_staged[0]
-            ix = i + 1
-            if ix != ix0:
-                varedsized[ix], varedsized[ix0] = varedsized[ix0], varedsized[ix]
-        onlysized.sort(key=lambda g: g.__ctx_len__(ctx))
-        onlyvared.sort(key=lambda g: entanglement[g], reverse=True)
+        # Order keys are computed once, not on every comparison.
+        order_keys = {g: sizes[g] / (entanglement[g] + 1) for g in varedsized}
+        varedsized.sort(key=order_keys.__getitem__)
+        if len(varedsized) > 2:
+            # Next goal is popped from a heap of goals staged by the chain,
+            # or of all goals if the chain is broken, and swapped into the
+            # next position.  Ties rank by current position, so a goal
+            # swapped out is pushed again at its new position, and entries
+            # of placed goals or of former positions are skipped.
+            # Entries are unique by push count, so goals aren't compared.
+            pos: dict[GoalVared, int] = {
+                g: r for r, g in enumerate(varedsized)}
+            remaining: list[tuple[float, int, int, GoalCtxSizedVared]] = [
+                (order_keys[g], r, r, g)  # sorted, so a heap
+                for r, g in enumerate(varedsized)]
+            pushes = len(remaining)
+            staged_heap: list[tuple[float, int, int, GoalCtxSizedVared]] = []
+            staged: set[GoalVared] = set()
+            for i in range(len(varedsized) - 2):
+                for g in (cast(GoalCtxSizedVared, g)
+                          for v in g2v[varedsized[i]] for g in v2g[v]
+                          if g in pos and pos[g] > i):
+                    if g not in staged:
+                        staged.add(g)
+                        heappush(staged_heap,
+                                 (order_keys[g], pos[g], pushes, g))
+                        pushes += 1
+                staged.discard(varedsized[i])
+                # if chain is broken, we act as if remaining goals were
+                # staged for the iteration.
+                heap = staged_heap if staged else remaining
+                while heap[0][1] <= i or heap[0][1] != pos[heap[0][3]]:
+                    heappop(heap)
+                goal = heappop(heap)[3]
+                ix, ix0 = i + 1, pos[goal]
+                if ix != ix0:
+                    swapped = varedsized[ix]
+                    varedsized[ix], varedsized[ix0] = goal, swapped
+                    pos[goal], pos[swapped] = ix, ix0
+                    entry = (order_keys[swapped], ix0, pushes, swapped)
+                    pushes += 1
+                    heappush(remaining, entry)
+                    if swapped in staged:
+                        heappush(staged_heap, entry)
+        onlysized.sort(key=sizes.__getitem__)
+        onlyvared.sort(key=entanglement.__getitem__, reverse=True)
         data_procced = (connective, constraints, tuple(chain(
             varedsized, onlysized, onlyvared, others)))
         # TODO: decide if broadcast or event hook needs to run or not
@@ -3,11 +3,10 @@
 from __future__ import annotations
 from abc import ABC
 from time import perf_counter_ns, time_ns
-from typing import Any, ClassVar, Final, Iterable, Iterator, Protocol, Self, cast
+from typing import Any, Callable, ClassVar, Final, Iterable, Self, cast
 
 import numpy          as NP
 import more_itertools as MI
-import scipy.stats    as SS  # pyright: ignore[reportMissingTypeStubs]
 
 from  .Types      import ( Ctx, isBroadcastKey, HookEventCB #
                          , HookBroadcastCB, BroadcastKey    )
@@ -60,18 +59,34 @@ float_dtype: Final[NP.dtype[Any]] = NP.dtype([
 nan: NP.float64 = NP.float64(NP.nan)
 
 
-class DescribeResults(Protocol):
-    """Typing helper for scipy.stats.describe() results."""
-    nobs    : int
-    minmax  : tuple[Any, Any]
-    mean    : NP.float64
-    variance: NP.float64
-    skewness: NP.float64
-    kurtosis: NP.float64
+type F64 = NP.float64
+
+def _moments(vals: NP.ndarray[Any, Any]
+             ) -> tuple[Any, Any, F64, F64, F64, F64]:
+    """Min, max, mean, variance, skewness and kurtosis of observations.
+
+    Same semantics as scipy.stats.describe() (unbiased variance, biased
+    skewness and excess kurtosis), without its per-call dispatch and
+    without the separate per-moment passes over the data.
+    """
+    n    = vals.shape[0]
+    mean = vals.mean()
+    dev  = vals - mean
+    dev2 = dev * dev
+    m2   = dev2.sum()
+    if m2 == 0.0:
+        return vals.min(), vals.max(), mean, m2, nan, nan
+    m3   = (dev2 * dev).sum()
+    m4   = (dev2 * dev2).sum()
+    return (vals.min(), vals.max(), mean, m2 / (n - 1),
+            n**0.5 * m3 / m2**1.5, n * m4 / (m2 * m2) - 3.0)
 
 
 class MetricsObsBuf(FacetABC[Any, tuple[int, Cel[Any]]]):
-    """Facet for buffering observations per sensor."""
+    """Facet for buffering observations per sensor.
+
+    Sensors don't use it anymore: they buffer into `Metrics.obs_buffers`.
+    """
     default: ClassVar[tuple[int, Cel[Any]]] = (0, ())
     
     @classmethod
@@ -158,6 +173,9 @@ class MetricsRegistry(FacetABC[Any, 'Metrics.Sensor[Any] | None']):
 
 class Metrics:
     ctx: Ctx  # Metrics needs to own own context.
+    # Observations of the current second per sensor key.  They're mutated
+    # in place, so they're owned here instead of by the immutable context.
+    obs_buffers: dict[Any, list[Any]]
     
     # Designed to be singleton, but not limited to be so.
     _Singleton: Self | None = None
@@ -167,6 +185,7 @@ class Metrics:
     
     def __init__(self: Self, ctx: Ctx | None = None) -> None:
         self.ctx = ctx if ctx else Map()
+        self.obs_buffers = {}
         self._perf_ns_sec_threshold = self._compute_perf_ns_sec_threshold(
             perf_counter_ns(), time_ns())
     
@@ -244,7 +263,11 @@ class Metrics:
         ini: NP.dtype[Any]
         obs_dtype: Any
         per_sec_stats_rec_dtype: NP.dtype[Any]
+        _empty_rec: NP.ndarray[Any, Any]
         _metrics: Metrics
+        _perf_ns: Callable[[], int]
+        _obs: list[Any]
+        _observe: Callable[[Any], None]
         skip_stats_timeseries: bool
 
         def __init__(
@@ -265,12 +288,21 @@ class Metrics:
             else:
                 raise TypeError(f"Unsupported type: {typ}")
             self.ini = self.obs_to_dtype(ini)
+            # Summary of a second without observations, but the timestamp.
+            self._empty_rec = NP.array(
+                (0, 0, self.ini, self.ini, nan, nan, nan, nan),
+                dtype=self.per_sec_stats_rec_dtype)
             self.key = key if key else self
             self._metrics = metrics if metrics else Metrics.Singleton()
+            self._perf_ns = self._metrics._perf_ns  # bound once, called often
             self._metrics.ctx = MetricsRegistry.register(
                 self._metrics.ctx, self.key, self)
             
             self.skip_stats_timeseries = skip_stats_timeseries
+            if not skip_stats_timeseries:
+                # Observations go straight into the sensor's buffer.
+                self._obs = self._metrics.obs_buffers.setdefault(self.key, [])
+                self._observe = self._obs.append
             self._metrics._hook_per_sec(self._per_sec_hook)
 
         def obs_to_dtype(self: Self, obs: N) -> NP.dtype[Any]:
@@ -281,17 +313,22 @@ class Metrics:
             #       ╰────────────────────────────────────────────────────────╯ 
             
             def __call__(self: Self, val: N) -> N:
-                ctx = self._metrics.ctx
-                self._metrics._perf_ns()
+                key, metrics = self.key, self._metrics
+                # Tick first: per-second hooks may update metrics context.
+                self._perf_ns()
                 if not self.skip_stats_timeseries:
-                    ctx = MetricsObsBuf.observation(ctx, self.key, val)
-                ctx = HooksBroadcasts.run(
-                    ctx, (Metrics.Sensor, type(self)), (self.key, val))
-                if isBroadcastKey(self.key):
-                    ctx = HooksBroadcasts.run(ctx, self.key, val)
+                    self._observe(val)
+                ctx = metrics.ctx
+                # Most observations have no listeners: skip broadcasting.
+                sensor_key = (Metrics.Sensor, type(self))
+                if HooksBroadcasts.is_hooked(ctx, sensor_key):
+                    ctx = HooksBroadcasts.run(ctx, sensor_key, (key, val))
+                if isBroadcastKey(key):
+                    if HooksBroadcasts.is_hooked(ctx, key):
+                        ctx = HooksBroadcasts.run(ctx, key, val)
                 else:
-                    ctx = HooksEvents.run(ctx, self.key, val)
-                self._metrics.ctx = ctx
+                    ctx = HooksEvents.run(ctx, key, val)
+                metrics.ctx = ctx
                 return val
 
             #       ╭────────────────────────────────────────────────────────╮
@@ -299,10 +336,9 @@ class Metrics:
             #       ╰────────────────────────────────────────────────────────╯ 
             
             def __call__(self: Self, val: N) -> N:
-                self._metrics._perf_ns()
+                self._perf_ns()
                 if not self.skip_stats_timeseries:
-                    self._metrics.ctx = MetricsObsBuf.observation(
-                        self._metrics.ctx, self.key, val)
+                    self._observe(val)
                 return val
         
         #           ╭────────────────────────────────────────────────────────╮
@@ -313,57 +349,51 @@ class Metrics:
             if self.skip_stats_timeseries:
                 return ctx
             t_took, t_ns = data
-            key, ctx, ini = self.key, self._metrics.ctx, self.ini
-            nobs: int
-            cons: Cel[Any]
-            nobs, cons = MetricsObsBuf.get(ctx, key)
+            key, obs = self.key, self._obs
+            nobs = len(obs)
+            # NOTE: Records are built from tuples: a list would be taken
+            #       as a sequence of records, each broadcast to all fields.
+            # NOTE: CPython folds 10**9 into a constant, so it's cheaper
+            #       inline than a module-level name; only bind the globals.
+            #       The datetime64[ns] field takes int nanoseconds as is.
+            empty_rec = self._empty_rec
+            add_data = MetricsPerSec[NP.ndarray[Any, Any]].add_data
             for n in range(t_took, (1 if nobs > 0 else 0), -1):
                 # handle empty seconods, including this second if empty
-                MetricsPerSec.add_data(ctx, key,
-                    NP.array([
-                        NP.datetime64(t_ns - n * 10**9, 'ns'),
-                        NP.int64(0),  # nobs (number of observations)
-                        ini,  # min
-                        ini,  # max
-                        nan,  # mean
-                        nan,  # variance
-                        nan,  # skewness
-                        nan   # kurtosis
-                    ], dtype=self.per_sec_stats_rec_dtype))
+                rec = empty_rec.copy()
+                rec['time'] = t_ns - n * 10**9
+                ctx = add_data(ctx, key, rec)
             if nobs == 0:
                 return ctx  # no observations
             elif nobs == 1:
-                val = cons[0]  # pyright: ignore[reportGeneralTypeIssues]
+                val = obs[0]
                 ctx = MetricsPerSec.add_data(ctx, key, 
-                    NP.array([
-                        NP.datetime64(t_ns, 'ns'),
-                        NP.int64(1),     # nobs (number of observations)
+                    NP.array((
+                        t_ns,            # time (datetime64[ns])
+                        1,               # nobs (number of observations)
                         val,             # min
                         val,             # max
-                        NP.float64(val), # mean
+                        val,             # mean
                         nan,             # variance
                         nan,             # skewness
                         nan              # kurtosis
-                    ], dtype=self.per_sec_stats_rec_dtype))
+                    ), dtype=self.per_sec_stats_rec_dtype))
             else:
-                # Avoiding any temporary structures while creating ndarray
-                # for efficient computation of summary statistics.
-                obs_iter: Iterator[N] = iter(cons_to_iterable(cons))
-                vals = NP.fromiter(obs_iter, self.obs_dtype, nobs)
-                summary = cast(DescribeResults,
-                    SS.describe(vals)) # pyright: ignore[reportUnknownMemberType]
+                vals = NP.array(obs, self.obs_dtype)
+                min_, max_, mean, var, skew, kurt = _moments(vals)
                 ctx = MetricsPerSec.add_data(ctx, key,
-                    NP.array([
-                        NP.datetime64(t_ns, 'ns'),
-                        NP.int64(nobs),     # nobs (number of observations)
-                        summary.minmax[0],  # min
-                        summary.minmax[1],  # max
-                        summary.mean,       # mean
-                        summary.variance,   # variance
-                        summary.skewness,   # skewness
-                        summary.kurtosis    # kurtosis
-                    ], dtype=self.per_sec_stats_rec_dtype))
-            return MetricsObsBuf.set(ctx, key, MetricsObsBuf.default)
+                    NP.array((
+                        t_ns,            # time (datetime64[ns])
+                        nobs,            # nobs (number of observations)
+                        min_,            # min
+                        max_,            # max
+                        mean,            # mean
+                        var,             # variance
+                        skew,            # skewness
+                        kurt             # kurtosis
+                    ), dtype=self.per_sec_stats_rec_dtype))
+            obs.clear()  # keep the buffer's capacity for the next second
+            return ctx
     
     def _hook_all_sensors(self: Self,
         cb: HookBroadcastCB[tuple[Any, Any]],
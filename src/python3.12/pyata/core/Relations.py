@@ -5,20 +5,21 @@ from __future__ import annotations
 from abc import ABC
 from collections.abc import Sized
 from inspect import signature
-from functools import cache
 from typing import Any, Callable, Iterable, Self, cast
 
 import numpy as np, rich, rich.repr, rich.pretty
 
-from .Constraints import Constraints, Notin
+from .Constraints import (Constraints, ConstraintVarsABC, Notin,
+                          PositiveCardinalityProduct )
 from .Facets      import (HooksBroadcasts, HookBroadcastCB, BroadcastKey,
-                          HookPipelineCB, HooksPipelines, Hypotheticals )
+                          HookPipelineCB, HooksPipelines, Hypotheticals,
+                          HooksEffectfulCBs, Indirections, BoundedMemo )
 from .Goals       import And, GoalVaredABC, ConjunctiveHeuristic, discriminate_goals, \
-                         HeurConjChainVars
+                         HeurConjChainVars, infer_name
 from .Types       import Constraint, Ctx, Goal, Var, Arg, GoalCtxSizedVared, Stream, \
                          Relation, Reifier, Named, CtxInstallable, GoalVared
 from .Unification import Unification
-from .Vars        import Substitutions, Vars
+from .Vars        import Substitutions, Vars, __
 from ..config     import Settings
 
 
@@ -30,65 +31,172 @@ __all__: list[str] = [
 
 type ND1 = tuple[int]
 type ND2 = tuple[int, int]
+type Rows = np.ndarray[ND1, np.dtype[np.intp]]
+type Postings[A: np.dtype[Any]] = tuple[dict[A, Rows], ...]
+type Counts = np.ndarray[ND1, np.dtype[np.intp]]
+type Codes = np.ndarray[ND1, np.dtype[np.uint32]]
+type Encoding[A: np.dtype[Any]] = tuple[
+    np.ndarray[ND1, A],  # values, by code
+    dict[A, int],        # codes, by value
+    Codes]               # column codes
+type Encodings[A: np.dtype[Any]] = tuple[Encoding[A] | None, ...]
+# Per free argument: whether it's substituted, its value or the values
+# excluded, and the value's type where equal values of other types select
+# the same facts (1, 1.0 and True), to keep selections of each apart.
+type Selection = tuple[tuple[bool, Any, type[Any] | None], ...]
 
 DEBUG = Settings().DEBUG
 
+SELECTIONS_MEMO_SIZE: int = 256
+"""Bound of memoized facts selections per `FactsTable.FactsGoal`."""
+
+CTX_LENS_MEMO_SIZE: int = 1024
+"""Bound of memoized context sizes per `FactsTable.FactsGoal`."""
+
+
+def _value_counts[A: np.dtype[Any]](col: np.ndarray[ND1, A]
+) -> tuple[np.ndarray[ND1, A], Counts]:
+    """Sorted unique values of a facts column and their counts.
+    
+    Small unsigned dtypes (e.g. bytes) are counted with a linear bincount
+    instead of the sort behind `np.unique`."""
+    if col.dtype.kind == 'u' and col.dtype.itemsize <= 2:
+        counts: Counts = np.bincount(col)
+        present: Rows = np.flatnonzero(counts)
+        unique = cast(np.ndarray[ND1, A], present.astype(col.dtype))
+        return unique, cast(Counts, counts[present])
+    return cast(tuple[np.ndarray[ND1, A], Counts],
+                np.unique(col, return_counts=True))
+
+
+def _columns[A: np.dtype[Any]](arr: np.ndarray[ND2, A]
+) -> tuple[np.ndarray[ND1, A], ...]:
+    """Contiguous columns of a facts array, for column-wise filtering."""
+    farr = np.asfortranarray(arr)
+    return tuple(farr[:, col] for col in range(farr.shape[1]))
+
+
+def _index_columns[A: np.dtype[Any]](cols: tuple[np.ndarray[ND1, A], ...]
+) -> tuple[dict[int, dict[A, int]], Postings[A], Encodings[A]]:
+    """Value counts, ascending indexes of the facts rows holding each value,
+    and encodings of non-numeric values, per column.
+    
+    Object and string columns are dictionary-encoded to `uint32` codes, so
+    they're compared and counted as integers."""
+    distrib: dict[int, dict[A, int]] = {}
+    postings: list[dict[A, Rows]] = []
+    encodings: list[Encoding[A] | None] = []
+    unique: np.ndarray[ND1, A]
+    counts: Counts
+    order: Rows
+    for ix, col in enumerate(cols):
+        if col.dtype.kind in 'OSU':
+            unique, inverse, counts = cast(
+                tuple[np.ndarray[ND1, A], Rows, Counts],
+                np.unique(col, return_inverse=True, return_counts=True))
+            codes: Codes = inverse.astype(np.uint32)
+            encodings.append((unique, {val: code for code, val
+                                       in enumerate(unique)}, codes))
+            order = np.argsort(codes, kind='stable')
+        else:
+            unique, counts = _value_counts(col)
+            encodings.append(None)
+            order = np.argsort(col, kind='stable')
+        distrib[ix] = dict(zip(unique, counts.tolist()))
+        postings.append(dict(zip(
+            unique, np.split(order, np.cumsum(counts)[:-1]))))
+    return distrib, tuple(postings), tuple(encodings)
+
+
+_NO_ROWS: Rows = np.empty(0, dtype=np.intp)
+
 
 class RelationABC[*T, G: Goal](ABC, Relation[*T, G], Named):
     name: str
     
     def __init__(self: Self, *, name: str | None = None) -> None:
-        if name is not None:
-            self.name = name
-        else:
-            try:
-                self.name = self.__name__  # type: ignore
-            except AttributeError:
-                try:
-                    self.name = self.__class__.__name__  # type: ignore
-                except AttributeError as e:
-                    raise TypeError(
-                        f'Cannot infer name for {self!r}. '
-                    ) from e
+        self.name = infer_name(self, name)
 
 class FactsTable[A: np.dtype[Any], *T](
     RelationABC[*T, GoalCtxSizedVared], Sized
 ):
+    """Relation of facts, rows of a 2D numpy array.
+    
+    The table owns its facts: they're copied when it's built, unless
+    they're read-only and own their data already, and `arr` is read-only.
+    Facts change only by item assignment on the table, as on `arr`."""
     arr: np.ndarray[ND2, A]
     distribution: dict[int, dict[A, int]]
     # NOTE: We want to share as much stricture as possible with the produced
     #       goals, but also be able to handle facts changes, which should
     #       not affect already produced goals (since they are indemnepotent).
+    #       So goals share the read-only facts, and changing them through
+    #       the table copies them on write, detaching produced goals.
     arr_ver: int
-    arr_ver_latest_copy: tuple[int, np.ndarray[ND2, A]] | None
+    arr_ver_indexed: int
+    cols: tuple[np.ndarray[ND1, A], ...]
+    postings: Postings[A]
+    encodings: Encodings[A]
     is_static: bool
     
     class FactsGoal(GoalVaredABC, GoalCtxSizedVared):
         # NOTE: Goals are idempotent, so optimized specializations
         #       must be careful to not break this property.
         arr         : np.ndarray[ND2, A]
+        cols        : tuple[np.ndarray[ND1, A], ...]
+        postings    : Postings[A]
+        encodings   : Encodings[A]
         args        : tuple[*T]
         free_ixs    : tuple[int, ...]
         bound_ixs   : tuple[int, ...]
         
+        _free_args: tuple[tuple[int, Var], ...]
         _short_circuit_fail: bool
+        _filtered_memo: BoundedMemo[Ctx, Any]
+        _selections_memo: BoundedMemo[Selection, tuple[
+            np.ndarray[ND2, A], dict[Var, dict[A, int]]]]
+        _typed_selections: bool
+        _ctx_lens_memo: BoundedMemo[tuple[Any, ...], int]
+        _bound_rows: Rows | None
         
         def __init__(self        : Self,
                      arr         : np.ndarray[ND2, A],
                      distribution: dict[int, dict[A, int]],
                      *args       : *T,
-                     name        : str | None = None
+                     name        : str | None = None,
+                     cols        : tuple[np.ndarray[ND1, A], ...] | None = None,
+                     postings    : Postings[A] | None = None,
+                     encodings   : Encodings[A] | None = None
         ) -> None:
             super().__init__(name=name)
             self.arr = arr
+            # Row-major facts are unified row by row, and filtered column
+            # by column, so both layouts are kept, and rows of each value
+            # are indexed for selections.
+            self.cols = cols if cols is not None else _columns(arr)
+            if postings is None or encodings is None:
+                _, postings, encodings = _index_columns(self.cols)
+            self.postings = postings
+            self.encodings = encodings
             self.args = args
-            self.vars = tuple(var for var in args if isinstance(var, Var))
-            self.free_ixs = tuple(i for i, var in enumerate(args)
-                                  if isinstance(var, Var))
-            self.bound_ixs = tuple(i for i, var in enumerate(args)
-                                   if not isinstance(var, Var))
+            free_args: list[tuple[int, Var]] = []
+            bound_ixs: list[int] = []
+            for i, arg in enumerate(args):
+                if isinstance(arg, Var):
+                    free_args.append((i, arg))
+                else:
+                    bound_ixs.append(i)
+            self._free_args = tuple(free_args)
+            self.vars = tuple(var for _, var in free_args)
+            self.free_ixs = tuple(i for i, _ in free_args)
+            self.bound_ixs = tuple(bound_ixs)
             self._stream_distrib = None
             self._short_circuit_fail = False
+            # Contexts may hold unhashables, so the latest is kept by id.
+            self._filtered_memo = BoundedMemo(1, by_id=True)
+            self._selections_memo = BoundedMemo(SELECTIONS_MEMO_SIZE)
+            self._typed_selections = arr.dtype.hasobject
+            self._ctx_lens_memo = BoundedMemo(CTX_LENS_MEMO_SIZE)
             for bix in self.bound_ixs:
                 val: Any = args[bix]
                 isin: bool = False
@@ -99,12 +207,24 @@ class FactsTable[A: np.dtype[Any], *T](
                 if not isin:
                     self._short_circuit_fail = True
                     break
+            self._bound_rows = None
             if self._short_circuit_fail:
                 self.distribution = {}
             else:
-                self.distribution = cast(dict[Var, dict[A, int]],
-                    # we determined args[i] is a Var, so it is safe to cast
-                    {args[i]: distribution[i].copy() for i in self.free_ixs})
+                # Facts matching bound arguments don't depend on context,
+                # so they're selected once here: rows of the rarest value,
+                # narrowed down by the rest of the bound values.
+                postings = self.postings
+                vals: tuple[Any, ...] = args
+                bixs = sorted(self.bound_ixs, key=lambda bix: len(
+                    postings[bix].get(vals[bix], _NO_ROWS)))
+                for bix in bixs:
+                    self._bound_rows = self._narrowed(
+                        bix, self._bound_rows, vals[bix])
+                # Column distributions are only read, so they're shared
+                # with the table instead of copied per goal.
+                self.distribution = {
+                    var: distribution[i] for i, var in free_args}
         
         def _filtered(self: Self, ctx: Ctx
         ) -> tuple[
@@ -114,24 +234,32 @@ class FactsTable[A: np.dtype[Any], *T](
             dict[Var, Notin],         # expanded notin constraints
             tuple[int, ...]           # filtered free indexes
         ] | None:
-            mask: np.ndarray[ND1, np.dtype[np.bool_]] = np.ones(
-                self.arr.shape[0], dtype=bool)
-            for bix in self.bound_ixs:
-                mask &= (self.arr[:, bix] == self.args[bix])
+            # Sizing a goal and then invoking it filters for the same
+            # context back to back, so the latest result is memoized.
+            return self._filtered_memo(ctx, self._filter)
+        
+        def _filter(self: Self, ctx: Ctx
+        ) -> tuple[
+            Ctx,                      # context
+            np.ndarray[ND2, A],       # filtered array
+            dict[Var, dict[A, int]],  # filtered distribution
+            dict[Var, Notin],         # expanded notin constraints
+            tuple[int, ...]           # filtered free indexes
+        ] | None:
+            # Per free argument: its substituted value, or the values
+            # look-ahead excluded.
+            selection: list[tuple[bool, Any, type[Any] | None]] = []
             
-            # Filtered distribution and Notin constraints
-            flt_dst: dict[Var, dict[A, int]] = {}
-            notins : dict[Var, Notin       ] = {}
+            # Expanded Notin constraints
+            notins: dict[Var, Notin] = {}
             
             # NOTE: During goal creation, there is no context, and bound
             #       aguments are determined by how the relation was invoked.
             #       Here the goal was invoked, we have context, and unboud
             #       arguments could have subtitutions, which need to be
             #       treated like additional bound values during goal execution.
-            for fix in self.free_ixs:
-                var: Any = self.args[fix]
-                walked_var = var
-                assert isinstance(var, Var)
+            for var in self.vars:
+                walked_var: Any = var
                 
                 notins[var] = notin = self._get_var_notin(ctx, var)
                 
@@ -142,62 +270,129 @@ class FactsTable[A: np.dtype[Any], *T](
                     # If the domain is empty, we short-circuit
                     return
                 
-                # A filtered distribution of the variable
-                flt_dst[var] = {}
-                for val in self.distribution[var]:
-                    if val in domain:
-                        flt_dst[var][val] = self.distribution[var][val]
+                # Values left in the domain, for O(1) membership tests.
+                remaining = set(domain)
                 
                 # Further constraining based on context substitutions
                 ctx, val = Substitutions.walk(ctx, var)
                 if not isinstance(val, Var):
-                    if val not in domain:
-                        return
+                    try:
+                        if val not in remaining:
+                            return
+                    except TypeError:
+                        return  # val is not hashable, so not a fact value
                     notins[var] = notin.expand(
-                        v for v in flt_dst[var] if v != val)
+                        v for v in remaining if v != val)
                     ctx = Constraints.evolve_var_constraint(
                         ctx, var, notin, notins[var])
-                    flt_dst[var] = {val: self.distribution[var][val]}
-                    mask &= (self.arr[:, fix] == val)
-                elif not Hypotheticals.is_hypothetical(ctx):
+                    selection.append((True, val, cast(type[Any], type(val))
+                                      if self._typed_selections else None))
+                    continue
+                notin_adds: list[A] = []
+                if not Hypotheticals.is_hypothetical(ctx):
                     # We look-ahead if any possible values are unifiable,
                     # and if not, we mask failing facts, expand notin, and
                     # filter the distribution.
                     walked_var = val
-                    notin_adds: list[A] = []
                     ctx_ahead = Hypotheticals.get_hypothetical(ctx)
                     for val_ in domain:
                         ctx_ahead_ = Unification.unify(
                             ctx_ahead, walked_var, val_)
                         if ctx_ahead_ is Unification.Failed:
                             notin_adds.append(val_)
-                            del flt_dst[var][val_]
-                            if not flt_dst[var]:
+                            remaining.discard(val_)
+                            if not remaining:
                                 return
-                            mask &= (self.arr[:, fix] != val_)
                     if notin_adds:
                         notins[var] = notin.expand(notin_adds)
                         ctx = Constraints.evolve_var_constraint(
                             ctx, walked_var, notin, notins[var])
-
-            flt_arr: np.ndarray[ND2, A] = self.arr[mask]
+                selection.append((False, frozenset(notin_adds), None))
+            
+            # Selecting facts only depends on the selection, which recurs
+            # across contexts, so selections' results are memoized.
+            flt_arr, new_distrib = self._selections_memo(
+                tuple(selection), self._select)
             if flt_arr.shape[0] == 0:
                 return
+            return ctx, flt_arr, new_distrib, notins, self.free_ixs
+        
+        def _narrowed(self: Self, ix: int, rows: Rows | None, val: Any
+        ) -> Rows:
+            """Rows holding `val` at `ix`, of `rows` (None for all facts)."""
+            if rows is None:
+                return self.postings[ix].get(val, _NO_ROWS)
+            encoding = self.encodings[ix]
+            if encoding is None:
+                return rows[self.cols[ix][rows] == val]
+            _, codes, col = encoding
+            code = codes.get(val)
+            return _NO_ROWS if code is None else rows[col[rows] == code]
+        
+        def _select(self: Self, selection: Selection
+        ) -> tuple[
+            np.ndarray[ND2, A],       # selected array
+            dict[Var, dict[A, int]]   # selected distribution
+        ]:
+            cols, postings = self.cols, self.postings
+            rows = self._bound_rows  # None selects all facts
+            # Substituted values narrow rows first, the rarest first, so
+            # exclusions only scan what's left.
+            selected = tuple(zip(self.free_ixs, selection))
+            values = sorted(((fix, sel) for fix, (is_val, sel, _) in selected
+                             if is_val),
+                            key=lambda fix_val: len(postings[fix_val[0]].get(
+                                fix_val[1], _NO_ROWS)))
+            for fix, val in values:
+                rows = self._narrowed(fix, rows, val)
+                if not rows.size:
+                    return self.arr[rows], {}
+            for fix, (is_val, sel, _) in selected:
+                if not is_val and sel:
+                    # Values look-ahead excluded, in one pass over the column.
+                    col, excluded = cols[fix], list(sel)
+                    encoding = self.encodings[fix]
+                    if encoding is not None:
+                        _, codes, col = encoding
+                        excluded = [codes[val] for val in excluded
+                                    if val in codes]
+                    keep = ~np.isin(col if rows is None else col[rows],
+                                    np.array(excluded, dtype=col.dtype))
+                    rows = np.flatnonzero(keep) if rows is None else rows[keep]
+            
+            flt_arr: np.ndarray[ND2, A] = (
+                self.arr if rows is None else self.arr[rows])
             
             # Now we need to recalculate the distribution.
+            # Every free variable made it into the filtered distribution.
             new_distrib: dict[Var, dict[A, int]] = {}
-            free_ixs = tuple(i for i, arg in enumerate(self.args)
-                             if isinstance(arg, Var) and  arg in flt_dst)
-            for ix in free_ixs:
-                var = self.args[ix]
-                assert isinstance(var, Var)
+            if flt_arr.shape[0] == 0:
+                return flt_arr, new_distrib
+            if rows is None:
+                # Nothing was selected out, so counts are the goal's.
+                for var, var_dst in self.distribution.items():
+                    new_distrib[var] = dict(var_dst)
+                return flt_arr, new_distrib
+            for (ix, var), (is_val, sel, _) in zip(self._free_args,
+                                                   selection):
+                if is_val:
+                    # Every selected row holds the substituted value.
+                    new_distrib[var] = {sel: rows.size}
+                    continue
                 new_distrib[var] = {}
-                unique, counts = np.unique(flt_arr[:, ix],
-                                           return_counts=True)
-                for val, count in zip(unique, counts):
+                encoding = self.encodings[ix]
+                unique: np.ndarray[ND1, A]
+                counts: Counts
+                if encoding is None:
+                    unique, counts = _value_counts(cols[ix][rows])
+                else:
+                    values, _, col = encoding
+                    counts = np.bincount(col[rows], minlength=len(values))
+                    present: Rows = np.flatnonzero(counts)
+                    unique, counts = values[present], counts[present]
+                for val, count in zip(unique, counts.tolist()):
                     new_distrib[var][val] = count
-            
-            return ctx, flt_arr, new_distrib, notins, free_ixs
+            return flt_arr, new_distrib
         
         @staticmethod
         def _get_var_notin(ctx: Ctx, var: Var) -> Notin:
@@ -218,66 +413,153 @@ class FactsTable[A: np.dtype[Any], *T](
                     notin = notin.expand(cset)
             return notin
 
+        def filtered_facts(self: Self, ctx: Ctx
+        ) -> np.ndarray[ND2, A] | None:
+            """Facts left by filtering for context, None if none are left.
+            
+            Facts that would fail unification may be left too."""
+            if self._short_circuit_fail:
+                return None
+            filtered = self._filtered(ctx)
+            return None if filtered is None else filtered[1]
+        
         def __call__(self: Self, ctx: Ctx) -> Stream:
             if self._short_circuit_fail:
-                return
+                return ()
             # all this effort pays in gold by cutting exponential search
             # space growth of conjunctions as early as possible
             filtered = self._filtered(ctx)
             if filtered is None:
-                return
-            ctx, arr, distrib, notins, free_ixs = filtered
+                return ()
+            return self._unify_facts(filtered)
+        
+        def _unify_facts(self: Self, filtered: tuple[
+            Ctx,                      # context
+            np.ndarray[ND2, A],       # filtered array
+            dict[Var, dict[A, int]],  # filtered distribution
+            dict[Var, Notin],         # expanded notin constraints
+            tuple[int, ...]           # filtered free indexes
+        ]) -> Stream:
+            ctx, arr, distrib, notins, _ = filtered
             
-            ctx, arr = HooksPipelines.run(ctx, type(self).hook_facts, arr)
+            ctx, arr = HooksPipelines[np.ndarray[ND2, A]].run(
+                ctx, type(self).hook_facts, arr)
             
             success_key: BroadcastKey = (
                 FactsTable.FactsGoal, self.hook_factcheck_passed)
             failure_key: BroadcastKey = (
                 FactsTable.FactsGoal, self.hook_factcheck_failed)
+            # Broadcasts are skipped outright when nothing listens.
+            on_success = HooksBroadcasts.is_hooked(ctx, success_key)
+            on_failure = HooksBroadcasts.is_hooked(ctx, failure_key)
             size = arr.shape[0]
+            # Every fact starts from the same substitutions, so the free
+            # variables are walked once.  Ones already bound were filtered
+            # to match, wildcards match anything, and distinct unbound ones
+            # can be substituted as is, with facts' values, unless they're
+            # objects, which may be variables or hold them.
+            ctx, roots = Substitutions.walk_many(ctx, self.vars)
+            pairs = tuple((ix, root) for (ix, _), root
+                          in zip(self._free_args, roots)
+                          if isinstance(root, Var) and root is not __)
+            bind: Callable[[Ctx, Var, Any], Ctx] = Substitutions.sub
+            if (arr.dtype.hasobject
+                or len({root for _, root in pairs}) < len(pairs)):
+                # Object facts, or aliased variables (the repeated ones
+                # have to unify): facts' values are unified.
+                pairs, bind = self._free_args, Unification.unify
+            # Several distinct unbound variables are substituted at once.
+            batched = bind is Substitutions.sub and len(pairs) > 1
+            sub_many = Substitutions.sub_many
             for i, fact in enumerate(arr):
                 # Enumeration of facts is equivalent to a disjunction, so
                 # each fact starts from the same context (i.e. different
                 # facts of an EDB are independent of each other).
-                ctx2 = ctx
-                broadcast_hook_data = (
-                    self, fact, i, size, distrib, notins)
-                for ix in free_ixs:
-                    var, val = self.args[ix], fact[ix]
-                    assert isinstance(var, Var)
-                    ctx2 = Unification.unify(ctx2, var, val)
-                    if ctx2 is Unification.Failed:
-                        ctx = HooksBroadcasts.run(
-                            ctx, failure_key, broadcast_hook_data)
-                        break
-                    # distrib[var][val] -= 1
-                    # if distrib[var][val] <= 0:
-                    #     # We expand the notin as soon as a val is exhausted
-                    #     notin = notins[var]
-                    #     notins[var] = notin.expand((val,))
-                    #     # NOTE: The constraint is expanded in the context
-                    #     #       of the current fact only.
-                    #     ctx2 = Constraints.evolve_var_constraint(
-                    #         ctx2, var, notin, notins[var])
+                if batched:
+                    ctx2 = sub_many(ctx, {var: fact[ix] for ix, var in pairs})
                 else:
-                    ctx = HooksBroadcasts.run(
-                        ctx, success_key, broadcast_hook_data)
-                    yield ctx2
+                    ctx2 = ctx
+                    for ix, var in pairs:
+                        val = fact[ix]
+                        ctx2 = bind(ctx2, var, val)
+                        if ctx2 is Unification.Failed:
+                            break
+                        # distrib[var][val] -= 1
+                        # if distrib[var][val] <= 0:
+                        #     # We expand the notin as soon as a val is
+                        #     # exhausted
+                        #     notin = notins[var]
+                        #     notins[var] = notin.expand((val,))
+                        #     # NOTE: The constraint is expanded in the context
+                        #     #       of the current fact only.
+                        #     ctx2 = Constraints.evolve_var_constraint(
+                        #         ctx2, var, notin, notins[var])
+                if ctx2 is Unification.Failed:
+                    if on_failure:
+                        ctx = HooksBroadcasts.run(ctx, failure_key, (
+                            self, fact, i, size, distrib, notins))
+                    continue
+                if on_success:
+                    ctx = HooksBroadcasts.run(ctx, success_key, (
+                        self, fact, i, size, distrib, notins))
+                yield ctx2
         
         def __len__(self: Self) -> int:
             return len(self.arr)
 
-        @cache
         def __ctx_len__(  # pyright: ignore[reportIncompatibleMethodOverride]
             self: Self, ctx: Ctx
         ) -> int:
             if self._short_circuit_fail:
                 return 0
+            # Heuristics size goals against the same bindings repeatedly,
+            # in contexts differing elsewhere, so sizes are memoized by
+            # what of the context sizing reads.
+            return self._ctx_lens_memo(self._ctx_fingerprint(ctx),
+                                       lambda _: self._ctx_len(ctx))
+        
+        def _ctx_len(self: Self, ctx: Ctx) -> int:
             filtered = self._filtered(ctx)
-            if filtered is None:
-                return 0
-            _, arr, _, _, _ = filtered
-            return arr.shape[0]
+            return 0 if filtered is None else filtered[1].shape[0]
+        
+        def _ctx_fingerprint(self: Self, ctx: Ctx) -> tuple[Any, ...]:
+            """What filtering for context reads of it.
+            
+            Per var: its value and constraints, Notins among them.  Outside
+            hypotheticals, look-ahead substitutes unbound vars, checking
+            their constraints, so vars those read are walked too, as are
+            vars of goals they size, which skip look-ahead, and hooks the
+            substitutions run are read as well."""
+            constraints = Constraints.get_whole(ctx)
+            is_hypothetical = Hypotheticals.is_hypothetical(ctx)
+            fingerprint: list[Any] = [is_hypothetical]
+            ahead: list[Var] = []
+            for var in self.vars:
+                ctx, val = Substitutions.walk(ctx, var)
+                cs = constraints.get(var, Constraints.default)
+                fingerprint.append((val, cs))
+                if isinstance(val, Var) and not is_hypothetical:
+                    ahead.append(val)
+            if not ahead:
+                return tuple(fingerprint)
+            fingerprint += (HooksPipelines.get_whole(ctx),
+                            HooksEffectfulCBs.get_whole(ctx),
+                            Indirections.get_whole(ctx))
+            read: dict[Var, None] = {}
+            for val in ahead:
+                read[val] = None
+                for c in constraints.get(val, Constraints.default):
+                    if isinstance(c, ConstraintVarsABC):
+                        read.update(dict.fromkeys(c.vars))
+                    if isinstance(c, PositiveCardinalityProduct):
+                        read.update(dict.fromkeys(
+                            gvar for g in c.goals if isinstance(g, GoalVared)
+                            for gvar in g.vars))
+            for var in read:
+                ctx, val = Substitutions.walk(ctx, var)
+                fingerprint.append((var, val, constraints.get(
+                    var, Constraints.default)))
+            return tuple(fingerprint)
         
         @classmethod
         def hook_facts(cls: type[Self], ctx: Ctx,
@@ -324,33 +606,41 @@ class FactsTable[A: np.dtype[Any], *T](
         assert len(arr) > 0
         name = '/'.join((name, str(arr.shape[1])))
         super().__init__(name=name)
+        arr = np.ascontiguousarray(arr)
+        if arr.flags.writeable or not arr.flags.owndata:
+            arr = arr.copy()  # so facts can't change behind the index
+        arr.flags.writeable = False
         self.arr = arr
-        distrib: dict[int, dict[A, int]] = {}
-        for col in range(arr.shape[1]):
-            distrib[col] = {}
-            unique, counts = np.unique(arr[:, col], return_counts=True)
-            for val, count in zip(unique, counts):
-                distrib[col][val] = count
-        self.distribution = distrib
         self.arr_ver = 0
-        self.arr_ver_latest_copy = None
+        self._index()
         self.is_static = is_static
-        if is_static:
-            self.__call__ = self.__static_call__
 
-    def __static_call__(self: Self, *args: *T) -> FactsGoal:
+    def __call__(self: Self, *args: *T) -> FactsGoal:
+        if self.arr_ver_indexed != self.arr_ver:
+            self._index()
         return self.FactsGoal(self.arr, self.distribution, *args,
-                              name=self.name)
+                              name=self.name, cols=self.cols,
+                              postings=self.postings,
+                              encodings=self.encodings)
     
-    def __call__(self: Self, *args: *T) -> FactsGoal:
-        if self.arr_ver_latest_copy is None:
-            self.arr_ver_latest_copy = (self.arr_ver, self.arr.copy())
-        co_ver, co_arr = self.arr_ver_latest_copy
-        if co_ver != self.arr_ver:
-            self.arr_ver_latest_copy = (self.arr_ver, self.arr.copy())
-            co_ver, co_arr = self.arr_ver_latest_copy
-        return self.FactsGoal(co_arr, self.distribution, *args,
-                              name=self.name)
+    def __setitem__(self: Self, key: Any, facts: Any) -> None:
+        """Change facts at `key`, as indexed by numpy.
+        
+        Facts are copied on write, so produced goals keep the facts they
+        were produced with, and the next goal reindexes the changed ones."""
+        if self.is_static:
+            raise TypeError(f"Static facts can't change: {self.name}")
+        arr = self.arr.copy()
+        arr[key] = facts
+        arr.flags.writeable = False
+        self.arr = arr
+        self.arr_ver += 1
+    
+    def _index(self: Self) -> None:
+        self.cols = _columns(self.arr)
+        self.distribution, self.postings, self.encodings = \
+            _index_columns(self.cols)
+        self.arr_ver_indexed = self.arr_ver
 
     def __len__(self: Self) -> int:
         return self.arr.shape[0]
@@ -470,6 +760,8 @@ class HeurFactsOrdRnd(
     def __call__(self: Self, ctx: Ctx,
         data: np.ndarray[ND2, Any]
     ) -> tuple[Ctx, np.ndarray[ND2, Any]]:
+        if data.shape[0] < 2:
+            return ctx, data  # nothing to shuffle, so nothing to copy
         return ctx, np.random.permutation(data)
 
 
@@ -481,33 +773,59 @@ class HeurConjRelevance(ConjunctiveHeuristic):
                           tuple[Goal, ...]]]:
         connective, constraints, goals = data
         varedsized, _, _, _ = discriminate_goals(goals)
+        if len(varedsized) < 2:
+            # nothing to be entangled with
+            return ctx, data
         ctx, entanglement, v2g, g2v = connective.get_ctx_entanglement(
             ctx, varedsized)
-        entangled_goals = {g for g in entanglement if entanglement[g] > 0}
-        entangled_vars = {v for v in v2g if len(v2g[v]) > 1}
+        # entanglement is keyed by `varedsized` goals only
+        entangled_goals = cast(set[GoalCtxSizedVared],
+                               {g for g, e in entanglement.items() if e > 0})
+        entangled_vars = {v for v, gs in v2g.items() if len(gs) > 1}
         relevance_goals: list[FactsTable.FactsGoal] = []
         n: int = 0
         for goal in entangled_goals:
-            assert isinstance(goal, GoalCtxSizedVared)
             relevant_vars = tuple(v for v in g2v[goal] if v in entangled_vars)
             if relevant_vars and len(relevant_vars) < len(goal.vars):
-                facts: set[tuple[Any, ...]] = set()
                 hyp = Hypotheticals.get_hypothetical(ctx)
-                for hyp in goal(hyp):
-                    fact: list[Any] = []
-                    for var in relevant_vars:
-                        hyp, val = Substitutions.walk(hyp, var)
-                        fact.append(val)
-                    facts.add(tuple(fact))
-                if facts and len(facts) < goal.__ctx_len__(ctx):
+                facts: np.ndarray[ND2, Any]
+                facts_goal = (goal if isinstance(goal, FactsTable.FactsGoal)
+                              and goal.arr.dtype != np.object_ else None)
+                # Relevant vars are walked, so they're mapped back to the
+                # goal's columns through its walked vars.
+                roots: tuple[Any, ...] = ()
+                if facts_goal is not None:
+                    hyp, roots = Substitutions.walk_many(hyp, facts_goal.vars)
+                if (facts_goal is not None
+                    and all(v in roots for v in relevant_vars)
+                ):
+                    # Filtered facts hold the relevant values already, so
+                    # they're gathered and deduplicated at once.  Facts
+                    # that would fail unification are kept, which only
+                    # makes the relevance goal less selective.
+                    filtered = facts_goal.filtered_facts(hyp)
+                    if filtered is None:
+                        continue
+                    ixs = [facts_goal.free_ixs[roots.index(v)]
+                           for v in relevant_vars]
+                    facts = np.unique(filtered[:, ixs], axis=0)
+                else:
+                    facts_set: set[tuple[Any, ...]] = set()
+                    for hyp in goal(hyp):
+                        fact: list[Any] = []
+                        for var in relevant_vars:
+                            hyp, val = Substitutions.walk(hyp, var)
+                            fact.append(val)
+                        facts_set.add(tuple(fact))
+                    facts = np.array([list(fact) for fact in facts_set])
+                if len(facts) and len(facts) < goal.__ctx_len__(ctx):
                     if isinstance(goal, Named):
                         goal_name = goal.name
                     else:
                         n += 1
                         goal_name = f'goal_{n}'
                     facts_rel = FactsTable[Any, Any](
-                        np.array([list(fact)
-                                  for fact in facts]),
+                        facts,
                         name=f'{type(self).__name__}({goal_name})',
                         is_static=True)
                     relevance_goals.append(facts_rel(*relevant_vars))
@@ -176,6 +176,8 @@ class FacetRichReprable(Facet[Any, Any], CtxClsRichReprable, Protocol): pass
 
 @runtime_checkable
 class CtxSelfRichReprable(Protocol):
+    __slots__ = ()
+    
     def __ctx_self_rich_repr__(self: Self, ctx: Ctx) -> tuple[Ctx, RichReprable]:
         raise NotImplementedError
 
@@ -198,11 +200,15 @@ class Stream(Protocol):
 # TODO: RichReprable, CtxSelfRichReprable
 @runtime_checkable
 class Goal(Protocol):
+    __slots__ = ()
+    
     def __call__(self: Self, ctx: Ctx) -> Stream:
         raise NotImplementedError
 
 @runtime_checkable
 class Vared(Protocol):
+    __slots__ = ()
+    
     vars: tuple[Var, ...]
     
     def get_ctx_vars(self: Self, ctx: Ctx) -> Iterable[Var]:
@@ -210,34 +216,48 @@ class Vared(Protocol):
 
 @runtime_checkable
 class CtxSized(Protocol):
+    __slots__ = ()
+    
     def __ctx_len__(self: Self, ctx: Ctx) -> int:
         raise NotImplementedError
 
 @runtime_checkable
 class MaybeCtxSized(Protocol):
+    __slots__ = ()
+    
     def __maybe_ctx_len__(self: Self, ctx: Ctx) -> int:
         raise NotImplementedError
 
 @runtime_checkable
-class GoalVared(Goal, Vared, Protocol): pass
+class GoalVared(Goal, Vared, Protocol):
+    __slots__ = ()
 
 @runtime_checkable
 class Progressable(Protocol):
+    __slots__ = ()
+    
     def progress(self: Self, cur: int, tot: int) -> None:
         raise NotImplementedError
 
 @runtime_checkable
 class Named(Protocol):
+    __slots__ = ()
+    
     name: str
 
 @runtime_checkable
-class GoalCtxSized(Goal, CtxSized, Progressable, Protocol): pass
+class GoalCtxSized(Goal, CtxSized, Progressable, Protocol):
+    __slots__ = ()
 
 @runtime_checkable
 class GoalCtxSizedVared(GoalCtxSized, Vared, Protocol):
+    __slots__ = ()
+    
     distribution: Mapping[Var, Mapping[Any, int]]
 
 class Connective(Goal, Protocol):
+    __slots__ = ()
+    
     def __init__(self: Self, goal: Goal, *g_or_c: Goal | Constraint) -> None:
         raise NotImplementedError
 
@@ -155,6 +155,19 @@ class Substitutions(FacetABC[Var, Any], FacetRichReprMixin[Var]):
         # Constraints are checked after substitution, and may fail unification.
         ctx, _ = HooksPipelines.run(ctx, cls.hook_substitution, (var, val))
         return ctx
+    
+    @classmethod
+    def sub_many(cls: type[Self], ctx: Ctx, subs: Mapping[Var, Any]) -> Ctx:
+        """Substitute distinct unbound vars at once."""
+        ctx = cls.update(ctx, subs)
+        # Constraints are checked after all the substitutions, and the
+        # first failed check fails unification.
+        run = HooksPipelines[tuple[Var, Any]].run
+        for var_val in subs.items():
+            ctx, _ = run(ctx, cls.hook_substitution, var_val)
+            if not ctx:
+                return ctx
+        return ctx
 
     @classmethod
     def walk(
@@ -181,6 +194,21 @@ class Substitutions(FacetABC[Var, Any], FacetRichReprMixin[Var]):
             _, sub, _ = val
         return ctx, sub
     
+    @classmethod
+    def walk_many(
+        cls: type[Self],
+        ctx: Ctx,
+        vars: Iterable[Var]
+    ) -> tuple[Ctx, tuple[Any, ...]]:
+        """Walk vars, reading substitutions once for the unbound ones."""
+        subs = cls.get_whole(ctx)
+        vals: list[Any] = []
+        for var in vars:
+            if var in subs:
+                ctx, var = cls.walk(ctx, var)
+            vals.append(var)
+        return ctx, tuple(vals)
+    
     @classmethod
     def _walk_condense(
         cls: type[Self],
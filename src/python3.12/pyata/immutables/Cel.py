@@ -41,14 +41,12 @@ def cons_from_iterable[T](iterable: Iterable[T]) -> Cel[T]:
 
 def cons_to_iterable[T](cell: Cel[T]) -> Iterable[T]:
     car: T
-    cdr: Cel[T]
-    empty: Cel[T] = ()
-    # TypeGuard is too expensive to use here.
+    # TypeGuard is too expensive to use here, and so is comparing to
+    # the empty tuple: truthiness of the cell is all we need.
     # while cons.is_not_empty(cell):
-    while cell != empty:
-        car, cdr = cell  # type: ignore
+    while cell:
+        car, cell = cell  # type: ignore
         yield car
-        cell = cdr
 
 
 def cons_reverse[T](cell: Cel[T]) -> Cel[T]:
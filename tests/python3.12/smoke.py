@@ -1,5 +1,9 @@
 
-from pytest import mark
+from pytest import mark, raises
+from time import perf_counter_ns
+from typing import Any
+
+import numpy as np
 
 from rich.pretty import pretty_repr
 
@@ -172,6 +176,18 @@ def test_BroadcastHooks():
     ...
 
 
+def test_BroadcastHooks_is_hooked():
+    ctx = NoCtx
+    def cb(ctx: Ctx, key: BroadcastKey, data: int) -> Ctx: return ctx
+    class Key: pass
+    assert not HooksBroadcasts.is_hooked(ctx, (Key, 1))
+    ctx = HooksBroadcasts[int].hook(ctx, (Key,), cb)
+    # Broadcasts reach callbacks hooked to any prefix of their key.
+    assert HooksBroadcasts.is_hooked(ctx, (Key,))
+    assert HooksBroadcasts.is_hooked(ctx, (Key, 1))
+    assert not HooksBroadcasts.is_hooked(ctx, (object, Key))
+
+
 expected = """Ctx(
     Constraints(
         x={Neq(Violation(), x=1, y=1)},
@@ -200,6 +216,58 @@ def test_Neq_repr():
     assert pretty_repr(CtxRichRepr(ctx)) == expected
     
 
+def test_constrain_all():
+    ctx = NoCtx
+    x, y, z = Var('x'), Var('y'), Var('z')
+    ctx = Neq(y, z).constrain(ctx)
+    constraints = (Neq(x, y), Distinct(x, y, z))
+    expected = ctx
+    for constraint in constraints:
+        expected = constraint.constrain(expected)
+    assert Constraints.constrain_all(ctx, constraints) == expected
+    assert len(Constraints.get(expected, y)) == 3
+
+    # Constraints registering themselves are left to do so.
+    registered: list[Constraint] = []
+    class SelfRegistered(Neq):
+        def constrain(self, ctx: Ctx) -> Ctx:
+            registered.append(self)
+            return ctx
+    own = SelfRegistered(x, z)
+    assert Constraints.constrain_all(ctx, (own,)) == ctx
+    assert registered == [own]
+
+
+def test_walk_many():
+    ctx = NoCtx
+    x, y, z, w = Var('x'), Var('y'), Var('z'), Var('w')
+    ctx = Substitutions.sub(ctx, x, y)
+    ctx = Substitutions.sub(ctx, y, 1)
+    ctx = Substitutions.sub(ctx, z, w)
+    walked_ctx, vals = Substitutions.walk_many(ctx, (x, y, z, w, __))
+    assert vals == (1, 1, w, w, __)
+    for var, val in zip((x, y, z, w), vals):
+        assert Substitutions.walk(walked_ctx, var)[1] == val
+    assert Substitutions.walk_many(ctx, ()) == (ctx, ())
+
+
+def test_sub_many():
+    ctx = NoCtx
+    x, y = Var('x'), Var('y')
+    ctx = Substitutions.sub_many(ctx, {x: 1, y: 2})
+    assert Substitutions.walk_many(ctx, (x, y))[1] == (1, 2)
+
+    # Substitution hooks stop at the first failure.
+    checked: list[Var] = []
+    def failing_cb(ctx: Ctx, data: tuple[Var, int]
+                   ) -> tuple[Ctx, tuple[Var, int]]:
+        checked.append(data[0])
+        return Unification.Failed, data
+    ctx = Substitutions.hook_substitution(NoCtx, failing_cb)
+    assert Substitutions.sub_many(ctx, {x: 1, y: 2}) is Unification.Failed
+    assert checked == [x]
+
+
 def test_iterable_unification():
     ctx = NoCtx
     ctx = Unification.hook_unify(ctx, UnificationIterables.unify_hook)
@@ -290,6 +358,280 @@ def test_iterable_unification():
     assert ctx is not Unification.Failed
 
 
+def test_goal_streams():
+    ctx = NoCtx
+    ctx, (x,) = Vars.fresh(ctx, int, 1)
+
+    def solve(goal: Goal) -> list[tuple[int, ...]]:
+        return [i for i in Solver(ctx, (x,), goal, extensions=())]
+
+    assert solve(Fail()) == []
+    assert solve(And(Eq(x, 1), Succeed())) == [(1,)]
+    assert solve(And(Eq(x, 1), Fail())) == []
+    assert solve(Or(Or(Eq(x, 1), Eq(x, 2), Eq(x, 3)),
+                    Fail(),
+                    Or(Eq(x, 4), Eq(x, 5)))
+                 ) == [(1,), (4,), (2,), (5,), (3,)]
+
+
+def test_entanglement():
+    ctx = NoCtx
+    ctx, (x, y, z) = Vars.fresh(ctx, int, 3)
+    T = FactsTable[Any, Any, Any](np.array([[1, 2], [2, 3]]), 'T')
+    g1, g2, g3 = T(x, y), T(y, z), T(x, x)
+    conj = And(g1, g2)
+    assert conj.var_to_goals[y] == Set[GoalVared]((g1, g2))
+    assert dict(conj.get_entanglement()) == {g1: 1, g2: 1}
+    assert conj.get_entanglement() is conj.get_entanglement()
+    assert dict(And(g1, g3).get_entanglement()) == {g1: 1, g3: 2}
+
+
+def test_HeurConjChainVars_ties():
+    ctx = NoCtx
+    ctx, (v0, v1, v2, v3, v4) = Vars.fresh(ctx, int, 5)
+    T4 = FactsTable[Any, Any, Any](np.arange(8).reshape(4, 2), 'T4')
+    T2 = FactsTable[Any, Any, Any](np.arange(4).reshape(2, 2), 'T2')
+    goals = (T4(v1, v4), T4(v4, v2), T4(v3, v0), T2(v0, v3), T2(v1, v2))
+    _, (_, _, ordered) = HeurConjChainVars()(ctx, (And(*goals), (), goals))
+    # Goals tied by order key are taken by their position, as goals
+    # chained before them left it.
+    assert [goals.index(g) for g in ordered] == [3, 2, 4, 1, 0]
+
+
+def test_facts_wildcards():
+    ctx = NoCtx
+    ctx, (y, z) = Vars.fresh(ctx, int, 2)
+    T = FactsTable[Any, Any, Any](np.array([[1, 1], [2, 2]]), 'T')
+    U = FactsTable[Any, Any, Any](np.array([[3, 3], [4, 4], [5, 5]]), 'U')
+
+    # Wildcards are never bound, so they don't join the goals.
+    assert sorted(Solver(ctx, (y, z), And(T(__, y), U(__, z)),
+                         extensions=())
+                  ) == [(1, 3), (1, 4), (1, 5), (2, 3), (2, 4), (2, 5)]
+
+
+def test_facts_object_vars():
+    ctx = NoCtx
+    ctx, (y, z, w) = Vars.fresh(ctx, int, 3)
+    ctx = Unification.unify(ctx, w, 5)
+    def table(var: Var) -> FactsTable[Any, Any, Any]:
+        arr = np.array([[1, None]], dtype=object)
+        arr[0, 1] = var
+        return FactsTable[Any, Any, Any](arr, 'T')
+
+    # Variables in object facts are unified, so never bound to themselves.
+    assert list(Solver(ctx, (y, z), table(w)(y, z))) == [(1, 5)]
+    assert list(Solver(ctx, (y, z), table(z)(y, z))) == [(1, z)]
+
+
+def test_facts_aliased_vars():
+    ctx = NoCtx
+    ctx, (x, y, z, w) = Vars.fresh(ctx, int, 4)
+    ctx = Unification.unify(ctx, x, y)
+    T1 = FactsTable[Any, Any, Any](np.array([[1, 1], [2, 2], [3, 3]]), 'T1')
+    T2 = FactsTable[Any, Any, Any](np.array([[1, 4], [2, 5], [9, 6]]), 'T2')
+
+    # Default heuristics relate goals by their walked vars.
+    assert sorted(Solver(ctx, (x, z, w), And(T1(x, z), T2(y, w)))
+                  ) == [(1, 1, 4), (2, 2, 5)]
+
+
+def test_facts_postings():
+    ctx = NoCtx
+    ctx, (y, z) = Vars.fresh(ctx, int, 2)
+    T = FactsTable[Any, Any, Any](np.array([[1, 2], [3, 2], [1, 4]]), 'T')
+    assert T.postings[0][1].tolist() == [0, 2]
+    assert T.postings[1][2].tolist() == [0, 1]
+    assert 5 not in T.postings[0]
+
+    # Bound and substituted args select the facts posted for their values.
+    assert sorted(Solver(ctx, (y,), T(1, y), extensions=())) == [(2,), (4,)]
+    assert list(Solver(ctx, (y,), T(5, y), extensions=())) == []
+    ctx = Unification.unify(ctx, z, 2)
+    assert sorted(Solver(ctx, (y,), T(y, z), extensions=())) == [(1,), (3,)]
+    assert list(Solver(ctx, (y,), And(T(1, y), T(y, z)),
+                       extensions=())) == []
+
+
+def test_facts_encoded():
+    ctx = NoCtx
+    ctx, (y, z, a) = Vars.fresh(ctx, str, 3)
+    ctx = Unification.unify(ctx, a, 'a')
+    for dtype in (str, object):
+        T = FactsTable[Any, Any, Any](
+            np.array([['a', 'x'], ['b', 'y'], ['a', 'z']], dtype=dtype), 'T')
+        assert all(encoding is not None for encoding in T.encodings)
+        assert sorted(Solver(ctx, (y,), T('a', y))) == [('x',), ('z',)]
+        assert list(Solver(ctx, (y,), T('c', y))) == []
+        assert sorted(Solver(ctx, (y, z), And(T(y, z), Neq(y, a)))
+                      ) == [('b', 'y')]
+
+
+def test_facts_change():
+    ctx = NoCtx
+    ctx, (y,) = Vars.fresh(ctx, int, 1)
+    arr = np.array([[1, 2], [3, 4]])
+    T = FactsTable[Any, Any, Any](arr, 'T')
+    goal = T(1, y)
+    with raises(ValueError):
+        T.arr[0, 1] = 5  # facts only change through the table
+    T[0, 1] = 5
+    assert arr[0, 1] == 2 and T.arr[0, 1] == 5
+
+    # Produced goals keep their facts, new goals see the changed ones.
+    assert list(Solver(ctx, (y,), goal, extensions=())) == [(2,)]
+    assert list(Solver(ctx, (y,), T(1, y), extensions=())) == [(5,)]
+    assert list(Solver(ctx, (y,), T(y, 2), extensions=())) == []
+
+    # Tables own their facts, so changing the given array changes nothing.
+    arr[1, 0] = 1
+    assert list(Solver(ctx, (y,), T(3, y), extensions=())) == [(4,)]
+    assert list(Solver(ctx, (y,), T(1, y), extensions=())) == [(5,)]
+
+    S = FactsTable[Any, Any, Any](arr, 'S', is_static=True)
+    with raises(TypeError):
+        S[0, 1] = 5
+
+
+def test_facts_ctx_lens():
+    ctx = Constraints.install(NoCtx)
+    ctx, (y, z, a) = Vars.fresh(ctx, int, 3)
+    T = FactsTable[Any, Any, Any](np.array([[1, 2], [3, 4]]), 'T')
+    goal = T(y, z)
+    ctx = Neq(y, a).constrain(ctx)
+    assert goal.__ctx_len__(ctx) == 2
+    # Sizes are memoized apart for bindings of vars constrained with
+    # the goal's, not only for the goal's own.
+    assert goal.__ctx_len__(Unification.unify(ctx, a, 1)) == 1
+    assert goal.__ctx_len__(Unification.unify(ctx, z, 4)) == 1
+    assert goal.__ctx_len__(Substitutions.sub(ctx, y, 5)) == 0
+
+
+def test_facts_typed_selections():
+    ctx = NoCtx
+    ctx, (x, y) = Vars.fresh(ctx, int, 2)
+    T = FactsTable[Any, Any, Any](
+        np.array([[1, 'a'], [2, 'b']], dtype=object), 'T')
+    goal = T(x, y)
+    # Equal values of other types select the same facts, memoized apart.
+    for val in (1, True, 1.0):
+        filtered = goal._filtered(  # pyright: ignore[reportPrivateUsage]
+            Unification.unify(ctx, x, val))
+        assert filtered is not None
+        (key, count), = filtered[2][x].items()
+        assert (key, type(key), count) == (val, type(val), 1)
+
+
+def test_BoundedMemo():
+    from pyata.core.Facets import BoundedMemo
+    calls: list[int] = []
+    def compute(key: int) -> int:
+        calls.append(key)
+        return -key
+    memo = BoundedMemo[int, int](2)
+    assert [memo(k, compute) for k in (1, 2, 1, 3, 1, 2)
+            ] == [-1, -2, -1, -3, -1, -2]
+    assert calls == [1, 2, 3, 2]  # the least recently used were evicted
+    assert len(memo) == 2
+
+    # Keyed by identity, equal keys miss and unhashable keys are fine.
+    calls.clear()
+    id_memo = BoundedMemo[list[int], int](1, by_id=True)
+    key = [1]
+    assert id_memo(key, lambda k: compute(len(k))) == -1
+    assert id_memo(key, lambda k: compute(len(k))) == -1
+    assert id_memo([1], lambda k: compute(len(k))) == -1
+    assert calls == [1, 1] and len(id_memo) == 1
+
+
+def tick_seconds(metrics: Metrics, n: int) -> None:
+    """Make the next sensor call tick `n` seconds."""
+    metrics._perf_ns_sec_threshold = (  # pyright: ignore[reportPrivateUsage]
+        perf_counter_ns() - (n - 1) * 10**9)
+
+
+def test_Metrics_obs_buffers():
+    from pyata.core.Metrics import MetricsPerSec
+    metrics = Metrics()
+    counter = Metrics.Counter(0, 'counter', metrics)
+    ctx = metrics.ctx
+    for val in (1, 2, 3):
+        counter(val)
+    # Observations are buffered by the metrics, not in their context.
+    assert metrics.obs_buffers['counter'] == [1, 2, 3]
+    assert metrics.ctx is ctx
+
+    # A second tick summarizes the buffer, then drains it.
+    tick_seconds(metrics, 1)
+    counter(4)
+    assert metrics.obs_buffers['counter'] == [4]
+    rec, *_ = MetricsPerSec[np.ndarray[Any, Any]].get_latest_seconds(
+        metrics.ctx, 'counter', 1)
+    assert (rec['nobs'], rec['min'], rec['max'], rec['mean']) == (3, 1, 3, 2)
+
+
+def test_Metrics_sensors_same_second():
+    from pyata.core.Metrics import MetricsPerSec
+    metrics = Metrics()
+    counter = Metrics.Counter(0, 'counter', metrics)
+    gauge = Metrics.Gauge(0, 'gauge', metrics)
+    counter(1)
+    gauge(2)
+    gauge(4)
+    tick_seconds(metrics, 1)
+    counter(1)
+    # Each sensor's summary is kept when they tick in the same second.
+    get_latest_seconds = MetricsPerSec[np.ndarray[Any, Any]].get_latest_seconds
+    rec, = get_latest_seconds(metrics.ctx, 'counter')
+    assert (rec['nobs'], rec['mean']) == (1, 1)
+    rec, = get_latest_seconds(metrics.ctx, 'gauge')
+    assert (rec['nobs'], rec['mean']) == (2, 3)
+
+
+def test_Metrics_per_sec_records():
+    from pyata.core.Metrics import MetricsPerSec
+    metrics = Metrics()
+    gauge = Metrics.Gauge(0.0, 'gauge', metrics)
+    gauge(1.0)
+    gauge(3.0)
+    tick_seconds(metrics, 1)
+    gauge(5.0)
+    rec, = MetricsPerSec[np.ndarray[Any, Any]].get_latest_seconds(
+        metrics.ctx, 'gauge')
+    # Each summary is a single record, not a record per field.
+    assert rec.shape == ()
+    assert (rec['nobs'], rec['min'], rec['max'], rec['mean'], rec['var']
+            ) == (2, 1.0, 3.0, 2.0, 2.0)
+
+
+def test_Metrics_empty_seconds():
+    from pyata.core.Metrics import MetricsPerSec
+    metrics = Metrics()
+    counter = Metrics.Counter(0, 'counter', metrics)
+    counter(1)
+    tick_seconds(metrics, 3)
+    counter(1)
+    recs = list(MetricsPerSec[np.ndarray[Any, Any]].get_latest_seconds(
+        metrics.ctx, 'counter'))
+    # Seconds without observations are recorded as empty summaries.
+    assert [rec['nobs'] for rec in recs] == [1, 0, 0]
+    assert recs[0]['time'] > recs[1]['time'] > recs[2]['time']
+
+
+def test_Metrics_tick_hooks_ctx():
+    class Ticks(FacetABC[str, int]):
+        default = 0
+    def ticks_cb(ctx: Ctx, data: tuple[int, float]) -> Ctx:
+        return Ticks.set(ctx, 'ticks', Ticks.get(ctx, 'ticks') + data[0])
+    metrics = Metrics()
+    counter = Metrics.Counter(0, 'counter', metrics)
+    metrics.hook_ticks(ticks_cb)
+    tick_seconds(metrics, 2)
+    counter(1)
+    # The observation ticking seconds keeps hooks' context updates.
+    assert Ticks.get(metrics.ctx, 'ticks') == 2
+
+
 @mark.skip
 def test_BinPU():
     ctx = NoCtx